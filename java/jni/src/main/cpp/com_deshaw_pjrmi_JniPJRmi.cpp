@@ -114,7 +114,9 @@ static bool error_check_for_get(JNIEnv* env, jstring filename,
         return false;
     }
 
-    if (strlen(env->GetStringUTFChars(filename, NULL)) == 0) {
+    // Ask for the length directly, rather than making a UTF-8 copy of the
+    // string just to measure it
+    if (env->GetStringUTFLength(filename) == 0) {
         throw_java_exception(
             env,
             "java/lang/IllegalArgumentException",
@@ -301,13 +303,18 @@ static void* pjrmi_array_from_shm(JNIEnv* env,
     }
 
     // Get the pointer from memory
+    void* result = NULL;
     try {
-        return des::pjrmi::mmap_bytes_from_shm(file, array_bytes, type);
+        result = des::pjrmi::mmap_bytes_from_shm(file, array_bytes, type);
     }
     catch (des::pjrmi::exception::io& e) {
         pjrmi_exception_handle(env, e);
-        return NULL;
     }
+
+    // We're done with the copy of the filename now
+    env->ReleaseStringUTFChars(filename, file);
+
+    return result;
 }
 
 /**
@@ -336,6 +343,7 @@ static void pjrmi_array_from_shm_cleanup(JNIEnv* env,
             "java/io/IOException",
             "Given filename is null"
         );
+        return;
     }
 
     try {
@@ -344,6 +352,9 @@ static void pjrmi_array_from_shm_cleanup(JNIEnv* env,
     catch (des::pjrmi::exception::io& e) {
         pjrmi_exception_handle(env, e);
     }
+
+    // We're done with the copy of the filename now
+    env->ReleaseStringUTFChars(filename, file);
 }
 
 // ------------------------------------------------------------------------- //
@@ -109,6 +109,12 @@ public class BlockingPipe
      */
     private final byte[] myData;
 
+    /**
+     * If the pipe's size is a power of two then the mask which turns a
+     * position into an index into {@link #myData}, else {@code -1}.
+     */
+    private final int myMask;
+
     /**
      * Whether the pipe is closed or not.
      */
@@ -130,6 +136,7 @@ public class BlockingPipe
         myInput  = new Input();
         myOutput = new Output();
         myData   = new byte[size];
+        myMask   = ((size & (size - 1)) == 0) ? size - 1 : -1;
         myClosed = false;
     }
 
@@ -176,7 +183,7 @@ public class BlockingPipe
         }
 
         // Read it out
-        final byte result = myData[(int)(myHead % myData.length)];
+        final byte result = myData[index(myHead)];
         myHead++;
 
         // Kick the other thread, which could be waiting
@@ -210,13 +217,29 @@ public class BlockingPipe
         }
 
         // Write in the byte
-        myData[(int)(myTail % myData.length)] = (byte)b;
+        myData[index(myTail)] = (byte)b;
         myTail++;
 
         // Kick the other thread if it's waiting
         LockSupport.unpark(myReader);
     }
 
+    /**
+     * Turn a position in the stream into an index into the pipe's buffer.
+     *
+     * @param position  The position to convert.
+     *
+     * @return the index for that position.
+     */
+    private int index(final long position)
+    {
+        // Positions are never negative so, for power-of-two sizes, the mask
+        // gives the same answer as the remainder but without the cost of a
+        // 64-bit division for every byte
+        return (myMask >= 0) ? (int)(position & myMask)
+                             : (int)(position % myData.length);
+    }
+
     /**
      * Close the pipe.
      */
@@ -8,6 +8,7 @@ import com.deshaw.util.Instrumentor;
 import com.deshaw.util.StringUtil;
 import com.deshaw.util.StringUtil.HashableSubSequence;
 import com.deshaw.util.ThreadLocalStringBuilder;
+import com.deshaw.util.concurrent.BoundedStack;
 import com.deshaw.util.concurrent.LockManager;
 import com.deshaw.util.concurrent.VirtualThreadLock;
 import com.deshaw.util.concurrent.VirtualThreadLock.VirtualThread;
@@ -26,6 +27,7 @@ import java.io.InputStream;
 import java.io.InputStreamReader;
 import java.io.IOException;
 import java.io.OutputStream;
+import java.io.UnsupportedEncodingException;
 
 import java.lang.annotation.Annotation;
 import java.lang.annotation.ElementType;
@@ -50,6 +52,8 @@ import java.net.Socket;
 import java.net.SocketException;
 import java.net.UnknownHostException;
 
+import java.nio.ByteBuffer;
+
 import java.util.Arrays;
 import java.util.ArrayList;
 import java.util.Collection;
@@ -67,7 +71,6 @@ import java.util.Objects;
 import java.util.Optional;
 import java.util.Random;
 import java.util.Set;
-import java.util.concurrent.ArrayBlockingQueue;
 import java.util.concurrent.BlockingQueue;
 import java.util.concurrent.ConcurrentHashMap;
 import java.util.concurrent.ExecutionException;
@@ -4756,9 +4759,13 @@ public abstract class PJRmi
         private final HandleMapping myHandleMapping;
 
         /**
-         * Our workers, if any. This will be null if useWorkers() is false.
+         * Our idle workers, if any, most recently used first, bounded to
+         * numWorkers(). This will be null if useWorkers() is false. It is
+         * touched for every request so it's a lock-free stack, rather than a
+         * blocking queue, and handing out the most recently used worker means
+         * we get the one which is most likely to still be awake and cache-warm.
          */
-        private final BlockingQueue<Worker> myWorkers;
+        private final BoundedStack<Worker> myWorkers;
 
         /**
          * Our method callers.
@@ -4836,7 +4843,7 @@ public abstract class PJRmi
 
             // Where our workers, if any, live etc
             if (useWorkers()) {
-                myWorkers        = new ArrayBlockingQueue<>(numWorkers());
+                myWorkers        = new BoundedStack<>(numWorkers());
                 myVirtualThreads = new HashMap<>();
             }
             else {
@@ -5306,16 +5313,22 @@ public abstract class PJRmi
 
                     // Otherwise, proceed with normal pickle protocol
                     else {
-                        // Convert it to a byte[] and compress
+                        // Pickle it and compress. We compress straight out
+                        // of the pickler's buffer, rather than a copy of it.
+                        final ByteBuffer pickled =
+                            ourPythonPickle.get().toByteBuffer(reference);
                         final byte[] bytes =
-                            Snappy.compress(
-                                ourPythonPickle.get().toByteArray(reference)
+                            getScratchByteArray(
+                                Snappy.maxCompressedLength(pickled.remaining())
                             );
+                        final int length =
+                            Snappy.compress(pickled.array(), 0, pickled.remaining(),
+                                            bytes, 0);
 
                         // Marshall it
                         out.writeByte(PythonValueFormat.SNAPPY_PICKLE.id);
-                        out.writeInt (bytes.length);
-                        out.write    (bytes, 0, bytes.length);
+                        out.writeInt (length);
+                        out.write    (bytes, 0, length);
                     }
                 }
             }
@@ -5347,7 +5360,6 @@ public abstract class PJRmi
             // How we pull in the data
             final ByteList payload = new ByteList(1024 * 1024);
             final byte[]   header  = new byte[17];
-            final byte[]   buffer  = new byte[64 * 1024];
 
             // Keep reading the stream socket until it's done
             while (true) {
@@ -5410,23 +5422,20 @@ public abstract class PJRmi
 
                     // Now read the payload. We keep reading until we believe
                     // that we got everything we care about. The payload might
-                    // be split over several packets etc.
+                    // be split over several packets etc. We read directly into
+                    // the payload list, instead of via an intermediate buffer,
+                    // since large messages (e.g. arrays) would otherwise be
+                    // copied twice.
                     int totalRead = 0;
                     while (totalRead < size) {
-                        // Pull in all the data we can into the local buffer
-                        final int read =
-                            myIn.read(
-                                buffer,
-                                0,
-                                Math.min(buffer.length, size - totalRead)
-                            );
+                        // Pull in all the data we can
+                        final int read = payload.read(myIn, size - totalRead);
 
                         // Check for EOF
                         if (read < 0) {
                             break;
                         }
                         else {
-                            payload.append(buffer, 0, read);
                             totalRead += read;
                         }
                     }
@@ -5922,19 +5931,26 @@ public abstract class PJRmi
                     pickle = myBestEffortPythonPickle.get();
                 }
 
-                // Convert it to a byte[], and possibly compress it
-                byte[] bytes = pickle.toByteArray(object);
+                // Pickle it, and possibly compress it. We work straight out
+                // of the pickler's buffer, rather than a copy of it.
+                final ByteBuffer pickled = pickle.toByteBuffer(object);
+                byte[] bytes  = pickled.array();
+                int    length = pickled.remaining();
                 if (valueFormat == PythonValueFormat.SNAPPY_PICKLE ||
                     valueFormat == PythonValueFormat.BESTEFFORT_SNAPPY_PICKLE)
                 {
-                    bytes = Snappy.compress(bytes);
+                    bytes  = getScratchByteArray(
+                                 Snappy.maxCompressedLength(length)
+                             );
+                    length = Snappy.compress(pickled.array(), 0, pickled.remaining(),
+                                             bytes, 0);
                 }
 
                 // Stuff this into our buffer
                 // Number of bytes sent = data size + valueFormat byte
-                bados.dataOut.writeInt (bytes.length + 1);
+                bados.dataOut.writeInt (length + 1);
                 bados.dataOut.writeByte(valueFormat.id);
-                bados.dataOut.write    (bytes, 0, bytes.length);
+                bados.dataOut.write    (bytes, 0, length);
 
                 // And package it up
                 buildMessage(buf.dataOut,
@@ -6167,79 +6183,79 @@ public abstract class PJRmi
                 }
 
                 // If it's sent natively down the wire then we convert from
-                // the raw bits
-                if (typeDesc.getName().equals("void")) {
+                // the raw bits. We switch on the type's name, which is hashed
+                // once, rather than testing it against each name in turn.
+                final String typeName = typeDesc.getName();
+                switch (typeName) {
+                case "void": {
                     // Like Method#invoke() we treat voids as nulls; there will
                     // not be any associated data.
                     result = null;
-                }
-                else if (typeDesc.getName().equals("boolean") ||
-                         typeDesc.getName().equals("java.lang.Boolean"))
-                {
+                }   break;
+
+                case "boolean":
+                case "java.lang.Boolean": {
                     result = Boolean.valueOf(
                         bytes.get(offset++) != 0
                     );
-                }
-                else if (typeDesc.getName().equals("byte") ||
-                         typeDesc.getName().equals("java.lang.Byte"))
-                {
+                }   break;
+
+                case "byte":
+                case "java.lang.Byte": {
                     result = Byte.valueOf(
                         bytes.get(offset++)
                     );
-                }
-                else if (typeDesc.getName().equals("double") ||
-                         typeDesc.getName().equals("java.lang.Double"))
-                {
+                }   break;
+
+                case "double":
+                case "java.lang.Double": {
                     result = Double.valueOf(
                         Double.longBitsToDouble(readLong(bytes, offset))
                     );
                     offset += Long.BYTES;
-                }
-                else if (typeDesc.getName().equals("float") ||
-                         typeDesc.getName().equals("java.lang.Float"))
-                {
+                }   break;
+
+                case "float":
+                case "java.lang.Float": {
                     result = Float.valueOf(
                         Float.intBitsToFloat(readInt(bytes, offset))
                     );
                     offset += Integer.BYTES;
-                }
-                else if (typeDesc.getName().equals("int") ||
-                         typeDesc.getName().equals("java.lang.Integer"))
-                {
+                }   break;
+
+                case "int":
+                case "java.lang.Integer": {
                     result = Integer.valueOf(readInt(bytes, offset));
                     offset += Integer.BYTES;
-                }
-                else if (typeDesc.getName().equals("long") ||
-                         typeDesc.getName().equals("java.lang.Long"))
-                {
+                }   break;
+
+                case "long":
+                case "java.lang.Long": {
                     result = Long.valueOf(readLong(bytes, offset));
                     offset += Long.BYTES;
-                }
-                else if (typeDesc.getName().equals("short") ||
-                         typeDesc.getName().equals("java.lang.Short"))
-                {
+                }   break;
+
+                case "short":
+                case "java.lang.Short": {
                     result = Short.valueOf(readShort(bytes, offset));
                     offset += Short.BYTES;
-                }
-                else if (typeDesc.getName().equals("char")                ||
-                         typeDesc.getName().equals("java.lang.Character") ||
-                         typeDesc.getName().equals("[C")                  ||
-                         typeDesc.getName().equals("java.lang.String"))
-                {
+                }   break;
+
+                case "char":
+                case "java.lang.Character":
+                case "[C":
+                case "java.lang.String": {
                     // Strings, char[]s, chars are sent over as UTF-16 strings
                     // and handled appropriately
                     final int count = readInt(bytes, offset);
                     offset += Integer.BYTES;
-                    final byte[] buffer = getByteArray(count);
-                    for (int i=0; i < count; i++) {
-                        buffer[i] = bytes.get(offset++);
-                    }
-                    final String string = new String(buffer, 0, count, "UTF-16");
+                    final String string = readUtf16(bytes, offset, count);
+                    offset += count;
 
                     // Switch to the desired type
-                    if (typeDesc.getName().equals("char") ||
-                        typeDesc.getName().equals("java.lang.Character"))
-                    {
+                    switch (typeName) {
+                    case "char":
+                    case "java.lang.Character":
                         if (string.length() != 1) {
                             throw new IllegalArgumentException(
                                 "Got a char in a String of length other than 1: " +
@@ -6247,99 +6263,90 @@ public abstract class PJRmi
                             );
                         }
                         result = Character.valueOf(string.charAt(0));
-                    }
-                    else if (typeDesc.getName().equals("[C")) {
+                        break;
+
+                    case "[C":
                         result = string.toCharArray();
-                    }
-                    else if (typeDesc.getName().equals("java.lang.String")) {
+                        break;
+
+                    case "java.lang.String":
                         result = string;
-                    }
-                    else {
-                        // Ensure that the if statements all match up
+                        break;
+
+                    default:
+                        // Ensure that the case statements all match up
                         throw new AssertionError("Unexpected type: " + typeDesc);
                     }
-                }
-                else if (typeDesc.getName().equals("[Z")) {
+                }   break;
+
+                case "[Z": {
                     final boolean[] array = new boolean[readInt(bytes, offset)];
                     offset += Integer.BYTES;
+                    // Bounds-check the whole range once and then read the
+                    // flags straight out of the backing array
+                    final byte[] data =
+                        wrap(bytes, offset, array.length, Byte.BYTES).array();
                     for (int i=0; i < array.length; i++) {
-                        array[i] = (
-                            bytes.get(offset++) != 0
-                        );
+                        array[i] = (data[offset + i] != 0);
                     }
+                    offset += array.length * Byte.BYTES;
                     result = array;
-                }
-                else if (typeDesc.getName().equals("[B")) {
+                }   break;
+
+                case "[B": {
                     final byte[] array = new byte[readInt(bytes, offset)];
                     offset += Integer.BYTES;
-                    for (int i=0; i < array.length; i++) {
-                        array[i] = (
-                            bytes.get(offset++)
-                        );
-                    }
+                    wrap(bytes, offset, array.length, Byte.BYTES).get(array);
+                    offset += array.length * Byte.BYTES;
                     result = array;
-                }
-                else if (typeDesc.getName().equals("[D")) {
+                }   break;
+
+                case "[D": {
                     final double[] array = new double[readInt(bytes, offset)];
                     offset += Integer.BYTES;
-                    for (int i=0; i < array.length; i++) {
-                        array[i] = Double.longBitsToDouble(readLong(bytes, offset));
-                        offset += Long.BYTES;
-                    }
+                    wrap(bytes, offset, array.length, Double.BYTES)
+                        .asDoubleBuffer().get(array);
+                    offset += array.length * Double.BYTES;
                     result = array;
-                }
-                else if (typeDesc.getName().equals("[F")) {
+                }   break;
+
+                case "[F": {
                     final float[] array = new float[readInt(bytes, offset)];
                     offset += Integer.BYTES;
-                    for (int i=0; i < array.length; i++) {
-                        array[i] = Float.intBitsToFloat(readInt(bytes, offset));
-                        offset += Integer.BYTES;
-                    }
+                    wrap(bytes, offset, array.length, Float.BYTES)
+                        .asFloatBuffer().get(array);
+                    offset += array.length * Float.BYTES;
                     result = array;
-                }
-                else if (typeDesc.getName().equals("[I")) {
+                }   break;
+
+                case "[I": {
                     final int[] array = new int[readInt(bytes, offset)];
                     offset += Integer.BYTES;
-                    for (int i=0; i < array.length; i++) {
-                        array[i] = readInt(bytes, offset);
-                        offset += Integer.BYTES;
-                    }
+                    wrap(bytes, offset, array.length, Integer.BYTES)
+                        .asIntBuffer().get(array);
+                    offset += array.length * Integer.BYTES;
                     result = array;
-                }
-                else if (typeDesc.getName().equals("[J")) {
+                }   break;
+
+                case "[J": {
                     final long[] array = new long[readInt(bytes, offset)];
                     offset += Integer.BYTES;
-                    for (int i=0; i < array.length; i++) {
-                        array[i] = readLong(bytes, offset);
-                        offset += Long.BYTES;
-                    }
+                    wrap(bytes, offset, array.length, Long.BYTES)
+                        .asLongBuffer().get(array);
+                    offset += array.length * Long.BYTES;
                     result = array;
-                }
-                else if (typeDesc.getName().equals("[S")) {
+                }   break;
+
+                case "[S": {
                     final short[] array = new short[readInt(bytes, offset)];
                     offset += Integer.BYTES;
-                    for (int i=0; i < array.length; i++) {
-                        array[i] = readShort(bytes, offset);
-                        offset += Short.BYTES;
-                    }
+                    wrap(bytes, offset, array.length, Short.BYTES)
+                        .asShortBuffer().get(array);
+                    offset += array.length * Short.BYTES;
                     result = array;
-                }
-                else if (typeDesc.getName().startsWith("[")) {
-                    // An array of <something>s with a known length
-                    final int length = readInt(bytes, offset);
-                    offset += Integer.BYTES;
+                }   break;
 
-                    // Create an array of the right type by reflection, and
-                    // populate it
-                    result = Array.newInstance(typeDesc.getArrayComponentType(),
-                                               length);
-                    for (int i=0; i < length; i++) {
-                        final ReadObjectResult ror = readObject(bytes, offset);
-                        offset = ror.offset;
-                        Array.set(result, i, ror.object);
-                    }
-                }
-                else if (typeDesc.getName().equals("java.util.Map")) {
+                case "java.util.Map": {
                     // How many entries
                     final int count = readInt(bytes, offset);
                     offset += Integer.BYTES;
@@ -6358,8 +6365,9 @@ public abstract class PJRmi
                     }
 
                     result = map;
-                }
-                else if (typeDesc.getName().equals("java.util.Set")) {
+                }   break;
+
+                case "java.util.Set": {
                     final int count = readInt(bytes, offset);
                     offset += Integer.BYTES;
 
@@ -6370,10 +6378,10 @@ public abstract class PJRmi
                         set.add(ror.object);
                     }
                     result = set;
-                }
-                else if (typeDesc.getName().equals("java.util.Collection") ||
-                         typeDesc.getName().equals("java.util.List"))
-                {
+                }   break;
+
+                case "java.util.Collection":
+                case "java.util.List": {
                     final int count = readInt(bytes, offset);
                     offset += Integer.BYTES;
 
@@ -6384,8 +6392,9 @@ public abstract class PJRmi
                         list.add(ror.object);
                     }
                     result = list;
-                }
-                else if (typeDesc.getName().equals("com.deshaw.pjrmi.PythonObject")) {
+                }   break;
+
+                case "com.deshaw.pjrmi.PythonObject": {
                     // A negative ID means null
                     final int objectId = readInt(bytes, offset);
                     offset += Integer.BYTES;
@@ -6394,8 +6403,9 @@ public abstract class PJRmi
                         : new PythonObjectImpl("PythonObject#" + objectId,
                                                objectId,
                                                myOut);
-                }
-                else if (typeDesc.getName().equals("com.deshaw.pjrmi.PythonSlice")) {
+                }   break;
+
+                case "com.deshaw.pjrmi.PythonSlice": {
                     ReadObjectResult ror = readObject(bytes, offset);
                     offset = ror.offset;
                     final Object sliceStart = ror.object;
@@ -6413,12 +6423,31 @@ public abstract class PJRmi
                         (sliceStop  != null) ? ((Number)sliceStop ).longValue() : null,
                         (sliceStep  != null) ? ((Number)sliceStep ).longValue() : null
                     );
-                }
-                else {
-                    throw new UnsupportedOperationException(
-                        "Don't know how to convert " + typeDesc + " " +
-                        "from raw bytes"
-                    );
+                }   break;
+
+                default: {
+                    if (typeName.startsWith("[")) {
+                        // An array of <something>s with a known length
+                        final int length = readInt(bytes, offset);
+                        offset += Integer.BYTES;
+
+                        // Create an array of the right type by reflection, and
+                        // populate it
+                        result = Array.newInstance(typeDesc.getArrayComponentType(),
+                                                   length);
+                        for (int i=0; i < length; i++) {
+                            final ReadObjectResult ror = readObject(bytes, offset);
+                            offset = ror.offset;
+                            Array.set(result, i, ror.object);
+                        }
+                    }
+                    else {
+                        throw new UnsupportedOperationException(
+                            "Don't know how to convert " + typeDesc + " " +
+                            "from raw bytes"
+                        );
+                    }
+                }   break;
                 }
             }   break;
 
@@ -6442,11 +6471,8 @@ public abstract class PJRmi
                 // First, we read the filename as a String
                 final int countString = readInt(bytes, offset);
                 offset += Integer.BYTES;
-                final byte[] bufferString = getByteArray(countString);
-                for (int i=0; i < countString; i++) {
-                    bufferString[i] = bytes.get(offset++);
-                }
-                final String filename = new String(bufferString, 0, countString, "UTF-16");
+                final String filename = readUtf16(bytes, offset, countString);
+                offset += countString;
 
                 if (LOG.isLoggable(Level.FINEST)) {
                     LOG.finest("SHMDATA filename: " + filename);
@@ -6463,11 +6489,8 @@ public abstract class PJRmi
                 // Read in the array type
                 final int countChar = readInt(bytes, offset);
                 offset += Integer.BYTES;
-                final byte[] bufferChar = getByteArray(countChar);
-                for (int i=0; i < countChar; i++) {
-                    bufferChar[i] = bytes.get(offset++);
-                }
-                final String stringType = new String(bufferChar, 0, countChar, "UTF-16");
+                final String stringType = readUtf16(bytes, offset, countChar);
+                offset += countChar;
 
                 // Let's make sure it was actually a char
                 if (stringType.length() != 1) {
@@ -6663,11 +6686,7 @@ public abstract class PJRmi
             final int size = readInt(payload, 0);
 
             // These are sent over as UTF-16
-            final byte[] buffer = getByteArray(size);
-            for (int i=0; i < size; i++) {
-                buffer[i] = payload.get(i + 4);
-            }
-            final String name = new String(buffer, 0, size, "UTF-16");
+            final String name = readUtf16(payload, 4, size);
 
             // Get the object
             final Object instance = getObjectInstance(name);
@@ -8132,6 +8151,53 @@ public abstract class PJRmi
                          bados.bytes);
         }
 
+        /**
+         * Get a ByteBuffer view of the given ByteList, which holds {@code count}
+         * elements of {@code elementSize} bytes each, starting at the given
+         * offset. This is used to decode primitive arrays in bulk, rather than
+         * element by element. The data is in network (big-endian) byte order,
+         * which is the ByteBuffer default.
+         *
+         * @throws IndexOutOfBoundsException if the ByteList is not big enough
+         *                                   to contain the data.
+         */
+        private ByteBuffer wrap(final ByteList bytes,
+                                final int      offset,
+                                final int      count,
+                                final int      elementSize)
+            throws IndexOutOfBoundsException
+        {
+            final long length = (long)count * elementSize;
+            if (offset < 0 || count < 0 || offset + length > bytes.size()) {
+                throw new IndexOutOfBoundsException(
+                    "Can't read " + count + " elements of size " + elementSize +
+                    " at offset " + offset + " from " + bytes.size() + " bytes"
+                );
+            }
+            return ByteBuffer.wrap(bytes.getArray(), offset, (int)length);
+        }
+
+        /**
+         * Decode a UTF-16 string, {@code count} bytes long, from the given
+         * offset in a ByteList. This is done straight from the ByteList's
+         * backing array, rather than first copying the bytes out into a
+         * scratch buffer.
+         *
+         * @throws IndexOutOfBoundsException if the ByteList is not big enough
+         *                                   to contain the data.
+         */
+        private String readUtf16(final ByteList bytes,
+                                 final int      offset,
+                                 final int      count)
+            throws IndexOutOfBoundsException,
+                   UnsupportedEncodingException
+        {
+            return new String(wrap(bytes, offset, count, Byte.BYTES).array(),
+                              offset,
+                              count,
+                              "UTF-16");
+        }
+
         /**
          * Read a boolean from a ByteList.
          */
@@ -8498,9 +8564,22 @@ public abstract class PJRmi
             protected byte[] initialValue()
             {
                 // 640k^H^H^H^H1Mb should be enough for anyone
-                return new byte[1024 * 1024];
+                return new byte[THREAD_LOCAL_BYTE_BUFFER_SIZE];
             }
         };
+    private static final int THREAD_LOCAL_BYTE_BUFFER_SIZE = 1024 * 1024;
+
+    /**
+     * Get a byte[] of at least the given size, for short-lived scratch use.
+     * Requests which fit into the thread-local byte[] are given that, to save
+     * allocating a new array every time. Larger ones get a new array since we
+     * don't want to pin a huge buffer to the thread forever.
+     */
+    private static byte[] getScratchByteArray(final int size)
+    {
+        return (size <= THREAD_LOCAL_BYTE_BUFFER_SIZE) ? getByteArray(size)
+                                                       : new byte[size];
+    }
 
     /**
      * Sort the given Methods into a reasonable ordering. This is the
@@ -6,6 +6,7 @@ import java.io.OutputStream;
 
 import java.net.InetAddress;
 import java.net.Socket;
+import java.net.SocketException;
 
 /**
  * A raw socket transport.
@@ -30,6 +31,16 @@ import java.net.Socket;
     {
         mySocket = socket;
         myString = String.valueOf(socket.getRemoteSocketAddress());
+
+        // We write out, and flush, whole messages at a time so we don't want
+        // Nagle's algorithm holding back the tail end of them while it waits
+        // for an ACK from the other side
+        try {
+            mySocket.setTcpNoDelay(true);
+        }
+        catch (SocketException e) {
+            // Not fatal, we will just be a little slower
+        }
     }
 
     /**
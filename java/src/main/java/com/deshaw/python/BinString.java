@@ -107,6 +107,12 @@ public class BinString
         if (this == o) {
             return true;
         }
+        if (o instanceof BinString) {
+            // Two of us can compare their byte buffers directly, which is
+            // done in bulk. Since each char is just a byte this is the same
+            // as comparing them char by char.
+            return myData.equals(((BinString) o).myData);
+        }
         if (!(o instanceof CharSequence)) {
             return false;
         }
@@ -129,9 +135,22 @@ public class BinString
     @Override
     public int hashCode()
     {
-        // Should match String.hashCode()'s API definition
+        // Should match String.hashCode()'s API definition. We unroll this
+        // four ways: since 31^4 * h + 31^3 * a + 31^2 * b + 31 * c + d is the
+        // same as four single steps, but the products of the characters don't
+        // depend on one another, they may be computed in parallel rather than
+        // each waiting on the previous step's multiply.
+        final int length = length();
         int result = 0;
-        for (int i = 0, length = length(); i < length; i++) {
+        int i = 0;
+        for (; i + 3 < length; i += 4) {
+            result = 31 * 31 * 31 * 31 * result +
+                          31 * 31 * 31 * charAt(i    ) +
+                               31 * 31 * charAt(i + 1) +
+                                    31 * charAt(i + 2) +
+                                         charAt(i + 3);
+        }
+        for (; i < length; i++) {
             result = 31*result + charAt(i);
         }
         return result;
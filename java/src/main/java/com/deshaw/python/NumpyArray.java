@@ -12,6 +12,7 @@ import java.util.Arrays;
 import java.util.ArrayList;
 import java.util.List;
 import java.util.Objects;
+import java.util.stream.IntStream;
 
 /**
  * Simple {@code numpy} array implementation.
@@ -23,6 +24,51 @@ import java.util.Objects;
  */
 public class NumpyArray
 {
+    /**
+     * The length of a side of the square tiles in which we copy 2D arrays.
+     * Tiles of this size keep the source and destination working set for an
+     * 8-byte type well within the L1 cache.
+     */
+    private static final int COPY_TILE_SIZE = 32;
+
+    /**
+     * How many elements an array must have before we spread the copying of it
+     * across the common fork-join pool's threads, when that is enabled. Below
+     * this the cost of farming out the work outweighs that of just doing it.
+     */
+    private static final int PARALLEL_COPY_THRESHOLD = 1 << 20;
+
+    /**
+     * How many elements of a large 1D array are given to each thread when it
+     * is copied in parallel.
+     */
+    private static final int PARALLEL_COPY_CHUNK_SIZE = 64 * 1024;
+
+    /**
+     * The alignment, in bytes, of the start of the direct buffers which we
+     * allocate. This is the size of a cache line, so that no element, nor any
+     * vector load of a whole cache line's worth of them, is split across two.
+     */
+    private static final int DIRECT_BUFFER_ALIGNMENT = 64;
+
+    /**
+     * Whether {@link #asType} and {@link #copyInto(NumpyArray)} copy large
+     * arrays in parallel by default. This is off unless asked for, since it
+     * makes use of the common fork-join pool, which the caller might have
+     * other plans for.
+     */
+    private static final boolean ourParallelCopy;
+    static {
+        final String prop = "com.deshaw.python.NumpyArray.parallelCopy";
+        try {
+            ourParallelCopy =
+                StringUtil.parseBoolean(System.getProperty(prop, "false"));
+        }
+        catch (Exception e) {
+            throw new RuntimeException("Bad value for " + prop, e);
+        }
+    }
+
     /**
      * Callback interface for {@link #visitElements(ElementVisitor)}.
      */
@@ -54,6 +100,13 @@ public class NumpyArray
      */
     private ByteBuffer myByteBuffer;
 
+    /**
+     * The byte buffer of the array which this one is ultimately a view onto,
+     * or our own if we are not a view. Arrays which have the same one of these
+     * may share data.
+     */
+    private ByteBuffer myBaseByteBuffer;
+
     /**
      * Number of dimensions.
      */
@@ -69,6 +122,11 @@ public class NumpyArray
      */
     private int[] myStrides;
 
+    /**
+     * Total number of elements in the array; computed once from the shape.
+     */
+    private int mySize;
+
     /**
      * Whether array data is stored in Fortran order (by column).
      */
@@ -88,6 +146,15 @@ public class NumpyArray
      */
     public static int[] getJavaArrayShape(final Object array)
     {
+        // The common case is a 1D array of primitives, for which we can give
+        // the answer directly instead of going via a list of boxed Integers
+        if (array != null) {
+            final Class<?> componentType = array.getClass().getComponentType();
+            if (componentType != null && componentType.isPrimitive()) {
+                return new int[] { Array.getLength(array) };
+            }
+        }
+
         List<Integer> shape = new ArrayList<>();
         getArrayShapeAndType(array, shape);
         int[] result = new int[shape.size()];
@@ -259,6 +326,33 @@ public class NumpyArray
         return elementType;
     }
 
+    /**
+     * Allocate a direct buffer whose data starts on a
+     * {@link #DIRECT_BUFFER_ALIGNMENT} byte boundary. The JVM only promises
+     * word alignment for these, so we over-allocate and skip to the boundary.
+     * If the buffer is too big to allow for that then it is left unaligned.
+     *
+     * @param sizeBytes  The size of the buffer to allocate.
+     *
+     * @return the buffer, positioned at its aligned start and limited to the
+     *         requested size.
+     */
+    private static ByteBuffer allocateAlignedDirect(final int sizeBytes)
+    {
+        if (sizeBytes > Integer.MAX_VALUE - (DIRECT_BUFFER_ALIGNMENT - 1)) {
+            return ByteBuffer.allocateDirect(sizeBytes);
+        }
+
+        final ByteBuffer buffer =
+            ByteBuffer.allocateDirect(sizeBytes + DIRECT_BUFFER_ALIGNMENT - 1);
+        final int offset = buffer.alignmentOffset(0, DIRECT_BUFFER_ALIGNMENT);
+        final int start  =
+            (offset == 0) ? 0 : DIRECT_BUFFER_ALIGNMENT - offset;
+        buffer.position(start);
+        buffer.limit(start + sizeBytes);
+        return buffer;
+    }
+
     /**
      * Whether the given DType is integer, or else floating point. If neither we
      * throw an {@link UnsupportedOperationException}.
@@ -345,7 +439,53 @@ public class NumpyArray
         final Class<?> componentType = source.getClass().getComponentType();
 
         if (componentType.isPrimitive()) {
-            if (integralDestinationType &&
+            // Handle the common array types directly, so as to avoid the
+            // reflective, and boxing, Array.getFoo() calls for each element
+            if (source instanceof double[]) {
+                final double[] array = (double[])source;
+                for (int i = 0; i < size; i++) {
+                    destination.set(dstLinearIx, array[i]);
+                    dstLinearIx += stride;
+                }
+            }
+            else if (source instanceof float[]) {
+                final float[] array = (float[])source;
+                for (int i = 0; i < size; i++) {
+                    destination.set(dstLinearIx, (double)array[i]);
+                    dstLinearIx += stride;
+                }
+            }
+            else if (source instanceof long[]) {
+                final long[] array = (long[])source;
+                if (integralDestinationType) {
+                    for (int i = 0; i < size; i++) {
+                        destination.set(dstLinearIx, array[i]);
+                        dstLinearIx += stride;
+                    }
+                }
+                else {
+                    for (int i = 0; i < size; i++) {
+                        destination.set(dstLinearIx, (double)array[i]);
+                        dstLinearIx += stride;
+                    }
+                }
+            }
+            else if (source instanceof int[]) {
+                final int[] array = (int[])source;
+                if (integralDestinationType) {
+                    for (int i = 0; i < size; i++) {
+                        destination.set(dstLinearIx, (long)array[i]);
+                        dstLinearIx += stride;
+                    }
+                }
+                else {
+                    for (int i = 0; i < size; i++) {
+                        destination.set(dstLinearIx, (double)array[i]);
+                        dstLinearIx += stride;
+                    }
+                }
+            }
+            else if (integralDestinationType &&
                 componentType != Float.TYPE &&
                 componentType != Double.TYPE)
             {
@@ -362,8 +502,11 @@ public class NumpyArray
             }
         }
         else {
+            // Not primitive so it must be an Object[] of some sort; index it
+            // directly rather than going through reflection
+            final Object[] array = (Object[])source;
             for (int i = 0; i < size; i++) {
-                Object v = Array.get(source, i);
+                Object v = array[i];
 
                 try {
                     Number n = (Number) v;
@@ -445,11 +588,7 @@ public class NumpyArray
      */
     public int size()
     {
-        int size = 1;
-        for (int i = 0; i < myNumDimensions; i++) {
-            size = Math.multiplyExact(size, myShape[i]);
-        }
-        return size;
+        return mySize;
     }
 
     /**
@@ -491,11 +630,14 @@ public class NumpyArray
             }
         }
 
-        return new NumpyArray(collapsedDim.dtype(),
-                              collapsedDim.isFortran(),
-                              newShape,
-                              newStrides,
-                              collapsedDim.myByteBuffer);
+        final NumpyArray view =
+            new NumpyArray(collapsedDim.dtype(),
+                           collapsedDim.isFortran(),
+                           newShape,
+                           newStrides,
+                           collapsedDim.myByteBuffer);
+        view.myBaseByteBuffer = myBaseByteBuffer;
+        return view;
     }
 
     /**
@@ -508,7 +650,8 @@ public class NumpyArray
      * @param to    The non-inclusive ending index of the element in that
      *              dimension.
      *
-     * @return the resultant view.
+     * @return the resultant view, which will be this array if the range
+     *         covers the whole dimension.
      */
     public NumpyArray slice(int dim, int from, int to)
     {
@@ -527,6 +670,11 @@ public class NumpyArray
             );
         }
 
+        // Taking the whole of the dimension gives back what we already have
+        if (from == 0 && to == dimSize) {
+            return this;
+        }
+
         // Update the shape. Slicing does not affect strides, so we
         // do not need to do anything about them.
         int[] newShape = myShape.clone();
@@ -537,7 +685,10 @@ public class NumpyArray
         view.position(view.position() + from * myStrides[dim]);
 
         // Create a sliced view of the array
-        return new NumpyArray(myDType, myIsFortran, newShape, myStrides, view);
+        final NumpyArray sliced =
+            new NumpyArray(myDType, myIsFortran, newShape, myStrides, view);
+        sliced.myBaseByteBuffer = myBaseByteBuffer;
+        return sliced;
     }
 
     /**
@@ -745,10 +896,31 @@ public class NumpyArray
                myStrides[2] * x3;
     }
 
+    /**
+     * Convert indices along the first four axes into a linear index.
+     *
+     * @param x1  The index along the first axis.
+     * @param x2  The index along the second axis.
+     * @param x3  The index along the third axis.
+     * @param x4  The index along the fourth axis.
+     *
+     * @return the linear index.
+     */
+    public int ix(int x1, int x2, int x3, int x4)
+    {
+        return myStrides[0] * x1 +
+               myStrides[1] * x2 +
+               myStrides[2] * x3 +
+               myStrides[3] * x4;
+    }
+
     /**
      * Convert an arbitrary-dimensional index into a linear index.
      * Any unspecified trailing indices are presumed to be 0.
      *
+     * <p>Callers with a fixed number of indices should prefer the fixed-arity
+     * overloads, since those avoid allocating the varargs array.
+     *
      * @param x  The indices.
      *
      * @return the linear index.
@@ -770,27 +942,36 @@ public class NumpyArray
      */
     public void visitElements(ElementVisitor visitor)
     {
-        int[] ixs = new int[numDimensions()];
-        internalVisitElements(visitor, ixs, 0);
-    }
+        final int   ndim = numDimensions();
+        final int[] ixs  = new int[ndim];
 
-    /**
-     * Recursive helper used to implement {@link #visitElements(ElementVisitor)}.
-     *
-     * @param visitor  The visitor to use.
-     * @param ixs      The indices to visit along.
-     * @param dim      The dimension which we are visiting.
-     */
-    private void internalVisitElements(ElementVisitor visitor, int[] ixs, int dim)
-    {
-        boolean lastDimension = dim == numDimensions() - 1;
-        for (int i = 0, size = shape(dim); i < size; i++) {
-            ixs[dim] = i;
-            if (lastDimension) {
+        // Nothing to visit if any of the dimensions are empty
+        for (int i = 0; i < ndim; i++) {
+            if (myShape[i] == 0) {
+                return;
+            }
+        }
+
+        // Walk the indices in C order, like an odometer. We run along the last
+        // dimension in a tight loop and then carry into the ones before it,
+        // rather than recursing once per dimension.
+        final int last     = ndim - 1;
+        final int lastSize = myShape[last];
+        while (true) {
+            for (int i = 0; i < lastSize; i++) {
+                ixs[last] = i;
                 visitor.visit(this, ixs);
             }
-            else {
-                internalVisitElements(visitor, ixs, dim + 1);
+
+            // Move to the next row, carrying as needed. If we carry off the
+            // front then we're done.
+            int dim = last - 1;
+            while (dim >= 0 && ++ixs[dim] == myShape[dim]) {
+                ixs[dim] = 0;
+                dim--;
+            }
+            if (dim < 0) {
+                return;
             }
         }
     }
@@ -799,23 +980,50 @@ public class NumpyArray
      * Roll an axis from one position to another. Returns a view into the array.
      *
      * <p>This method behaves like {@code moveaxis} method from numpy 1.11.
+     * If the axis does not move then this array is returned as-is.
      *
      * @param from  Old index of an axis.
      * @param to    New index of an axis.
      *
      * @return a rolled view of this array.
+     *
+     * @throws IllegalArgumentException if either axis is out of bounds.
      */
     public NumpyArray rollAxis(int from, int to)
     {
         final int ndim = numDimensions();
 
-        // Figure out how the axes are going to move
+        // Check that the axes are valid before doing anything else
+        if (from < 0 || from >= ndim) {
+            throw new IllegalArgumentException(
+                "Source axis must be between 0 and " + (ndim - 1) + ", " +
+                    "got " + from
+            );
+        }
+        if (to < 0 || to >= ndim) {
+            throw new IllegalArgumentException(
+                "Destination axis must be between 0 and " + (ndim - 1) + ", " +
+                    "got " + to
+            );
+        }
+
+        // Moving an axis to where it already is does nothing
+        if (from == to) {
+            return this;
+        }
+
+        // Figure out how the axes are going to move. The moved axis lands at
+        // index "to" so, when rolling backwards, it goes before the axis which
+        // is currently there, and when rolling forwards, after it.
         final int[] srcIxs = new int[ndim];
         for (int i=0, j=0; i < ndim; i++) {
+            if (i == to && to < from) {
+                srcIxs[j++] = from;
+            }
             if (i != from) {
                 srcIxs[j++] = i;
             }
-            if (i == to) {
+            if (i == to && to > from) {
                 srcIxs[j++] = from;
             }
         }
@@ -827,11 +1035,14 @@ public class NumpyArray
             newStrides[i] = myStrides[srcIxs[i]];
         }
 
-        return new NumpyArray(dtype(),
-                              myIsFortran,
-                              newShape,
-                              newStrides,
-                              myByteBuffer);
+        final NumpyArray view =
+            new NumpyArray(dtype(),
+                           myIsFortran,
+                           newShape,
+                           newStrides,
+                           myByteBuffer);
+        view.myBaseByteBuffer = myBaseByteBuffer;
+        return view;
     }
 
     /**
@@ -883,11 +1094,111 @@ public class NumpyArray
                 dtype,
                 isFortran,
                 shape(),
-                allocateDirect ? ByteBuffer.allocateDirect(newSizeBytes)
-                               : ByteBuffer.allocate      (newSizeBytes)
+                allocateDirect ? allocateAlignedDirect(newSizeBytes)
+                               : ByteBuffer.allocate   (newSizeBytes)
             );
 
-        final boolean integralDestinationType = integralType(dtype);
+        // If the element type and layout are unchanged, and this array is
+        // contiguous (so its strides match those of the new one), then the
+        // data is identical byte for byte. We can then do a bulk copy, which
+        // the JVM turns into a vectorised memory copy, instead of converting
+        // each element in turn.
+        if (dtype.equals(myDType)     &&
+            isFortran == myIsFortran &&
+            Arrays.equals(myStrides, dst.myStrides))
+        {
+            final ByteBuffer src = myByteBuffer.duplicate();
+            src.limit(newSizeBytes);
+            src.position(0);
+            dst.myByteBuffer.duplicate().put(src);
+            return dst;
+        }
+
+        return copyInto(dst);
+    }
+
+    /**
+     * Copy the contents of this array into the given one, converting them to
+     * its type as we go.
+     *
+     * <p>This lets callers which repeatedly convert arrays of the same shape
+     * reuse their destination array, instead of having {@link #asType} allocate
+     * and zero-fill a new one each time, only for it to be overwritten.
+     *
+     * <p>Large arrays are copied in parallel only if the
+     * {@code com.deshaw.python.NumpyArray.parallelCopy} system property is
+     * {@code true}.
+     *
+     * @param dst  The array to copy into. This must have the same shape as this
+     *             array, but may have any type and layout.
+     *
+     * @throws IllegalArgumentException if the shapes do not match.
+     *
+     * @return the given destination array.
+     */
+    public NumpyArray copyInto(final NumpyArray dst)
+        throws IllegalArgumentException
+    {
+        return copyInto(dst, ourParallelCopy);
+    }
+
+    /**
+     * Copy the contents of this array into the given one, converting them to
+     * its type as we go.
+     *
+     * <p>The destination may be a view onto this array's data, such as its
+     * transpose. In that case we copy from a temporary copy of this array, so
+     * that we don't overwrite elements before we have read them.
+     *
+     * @param dst       The array to copy into. This must have the same shape as
+     *                  this array, but may have any type and layout.
+     * @param parallel  Whether to spread the copying of a large array across
+     *                  the common fork-join pool's threads.
+     *
+     * @throws IllegalArgumentException if the shapes do not match.
+     *
+     * @return the given destination array.
+     */
+    public NumpyArray copyInto(final NumpyArray dst, final boolean parallel)
+        throws IllegalArgumentException
+    {
+        dst.validateShape("dst", myShape);
+
+        if (mayShareData(dst)) {
+            return copy().copyInto(dst, parallel);
+        }
+
+        final boolean integralDestinationType = integralType(dst.myDType);
+
+        // For arrays of two or more dimensions we walk the elements tile by
+        // tile. That way, when the source and destination layouts differ, the
+        // strided side of the copy stays within a small, cache-resident block.
+        if (myNumDimensions >= 2) {
+            copyTiled(dst, integralDestinationType, parallel);
+            return dst;
+        }
+
+        // Large 1D arrays may be split into chunks which are converted in
+        // parallel, like the rows of tiles are for 2D ones
+        if (myNumDimensions == 1) {
+            final int n = myShape[0];
+            if (parallel && n >= PARALLEL_COPY_THRESHOLD) {
+                final int numChunks =
+                    (n + PARALLEL_COPY_CHUNK_SIZE - 1) / PARALLEL_COPY_CHUNK_SIZE;
+                IntStream.range(0, numChunks)
+                         .parallel()
+                         .forEach(t -> {
+                             final int from = t * PARALLEL_COPY_CHUNK_SIZE;
+                             final int to   =
+                                 from + Math.min(PARALLEL_COPY_CHUNK_SIZE, n - from);
+                             copyRange1d(dst, integralDestinationType, from, to);
+                         });
+            }
+            else {
+                copyRange1d(dst, integralDestinationType, 0, n);
+            }
+            return dst;
+        }
 
         visitElements(
             (src, ixs) -> {
@@ -904,6 +1215,175 @@ public class NumpyArray
         return dst;
     }
 
+    /**
+     * Whether this array and the given one might share any of their data. This
+     * is the case if one is a view onto the other, or both are views onto the
+     * same array, or both wrap the same Java array. We don't look at whether
+     * the elements which they cover actually overlap.
+     *
+     * @param that  The array to compare against.
+     *
+     * @return whether the data might be shared.
+     */
+    private boolean mayShareData(final NumpyArray that)
+    {
+        if (myBaseByteBuffer == that.myBaseByteBuffer) {
+            return true;
+        }
+        return myByteBuffer.hasArray()      &&
+               that.myByteBuffer.hasArray() &&
+               myByteBuffer.array() == that.myByteBuffer.array();
+    }
+
+    /**
+     * Copy a range of the elements of this 1D array into the given one, which
+     * has the same shape, converting them as we go.
+     *
+     * @param dst       The array to copy into.
+     * @param integral  Whether the destination type is integral.
+     * @param from      The first index to copy, inclusive.
+     * @param to        The last index to copy, exclusive.
+     */
+    private void copyRange1d(final NumpyArray dst,
+                             final boolean    integral,
+                             final int        from,
+                             final int        to)
+    {
+        // Pick the conversion once, not once per element
+        if (integral) {
+            for (int i = from; i < to; i++) {
+                dst.set(dst.ix(i), _long(ix(i)));
+            }
+        }
+        else {
+            for (int i = from; i < to; i++) {
+                dst.set(dst.ix(i), _double(ix(i)));
+            }
+        }
+    }
+
+    /**
+     * Copy the contents of this array, of two or more dimensions, into the
+     * given one, which has the same shape, converting the elements as we go.
+     * Arrays of more than two dimensions are walked one 2D plane at a time,
+     * and each plane is copied tile by tile.
+     *
+     * @param dst       The array to copy into.
+     * @param integral  Whether the destination type is integral.
+     * @param parallel  Whether large planes may be copied in parallel.
+     */
+    private void copyTiled(final NumpyArray dst,
+                           final boolean    integral,
+                           final boolean    parallel)
+    {
+        if (myNumDimensions == 2) {
+            copyTiled2d(dst, integral, parallel);
+        }
+        else {
+            for (int i = 0; i < myShape[0]; i++) {
+                select(0, i).copyTiled(dst.select(0, i), integral, parallel);
+            }
+        }
+    }
+
+    /**
+     * Copy the contents of this 2D array into the given one, which has the same
+     * shape, converting the elements as we go. We do this in square tiles of
+     * {@link #COPY_TILE_SIZE} elements a side. Large arrays may have their rows
+     * of tiles copied in parallel; each row of tiles is a disjoint part of the
+     * destination so this needs no further coordination.
+     *
+     * @param dst       The array to copy into.
+     * @param integral  Whether the destination type is integral.
+     * @param parallel  Whether a large array may be copied in parallel.
+     */
+    private void copyTiled2d(final NumpyArray dst,
+                             final boolean    integral,
+                             final boolean    parallel)
+    {
+        final int rows = myShape[0];
+        if (parallel && size() >= PARALLEL_COPY_THRESHOLD) {
+            final int numTileRows = (rows + COPY_TILE_SIZE - 1) / COPY_TILE_SIZE;
+            IntStream.range(0, numTileRows)
+                     .parallel()
+                     .forEach(t -> copyTileRow(dst, integral, t * COPY_TILE_SIZE));
+        }
+        else {
+            for (int r0 = 0; r0 < rows; r0 += COPY_TILE_SIZE) {
+                copyTileRow(dst, integral, r0);
+            }
+        }
+    }
+
+    /**
+     * Copy a single row of tiles, starting at the given row, for
+     * {@link #copyTiled2d(NumpyArray,boolean,boolean)}.
+     *
+     * @param dst       The array to copy into.
+     * @param integral  Whether the destination type is integral.
+     * @param r0        The first row of the tiles.
+     */
+    private void copyTileRow(final NumpyArray dst,
+                             final boolean    integral,
+                             final int        r0)
+    {
+        // When the element type is unchanged we can move each element's raw
+        // bytes as they are, rather than converting them via a long or double
+        // and switching on the type for every read and write. We pick the
+        // width of the move up front; zero means that we must convert. The
+        // switch on it is made once per row of a tile, so that each of the
+        // inner loops is a tight one which the JIT can compile on its own.
+        final int rawWidth = myDType.equals(dst.myDType) ? myDType.size() : 0;
+        final ByteBuffer srcBuf = myByteBuffer;
+        final ByteBuffer dstBuf = dst.myByteBuffer;
+
+        final int r1   = Math.min(myShape[0], r0 + COPY_TILE_SIZE);
+        final int cols = myShape[1];
+        for (int c0 = 0; c0 < cols; c0 += COPY_TILE_SIZE) {
+            final int c1 = Math.min(cols, c0 + COPY_TILE_SIZE);
+            for (int r = r0; r < r1; r++) {
+                switch (rawWidth) {
+                case Long.BYTES:
+                    for (int c = c0; c < c1; c++) {
+                        dstBuf.putLong(dst.ix(r, c), srcBuf.getLong(ix(r, c)));
+                    }
+                    break;
+
+                case Integer.BYTES:
+                    for (int c = c0; c < c1; c++) {
+                        dstBuf.putInt(dst.ix(r, c), srcBuf.getInt(ix(r, c)));
+                    }
+                    break;
+
+                case Short.BYTES:
+                    for (int c = c0; c < c1; c++) {
+                        dstBuf.putShort(dst.ix(r, c), srcBuf.getShort(ix(r, c)));
+                    }
+                    break;
+
+                case Byte.BYTES:
+                    for (int c = c0; c < c1; c++) {
+                        dstBuf.put(dst.ix(r, c), srcBuf.get(ix(r, c)));
+                    }
+                    break;
+
+                default:
+                    if (integral) {
+                        for (int c = c0; c < c1; c++) {
+                            dst.set(dst.ix(r, c), _long(ix(r, c)));
+                        }
+                    }
+                    else {
+                        for (int c = c0; c < c1; c++) {
+                            dst.set(dst.ix(r, c), _double(ix(r, c)));
+                        }
+                    }
+                    break;
+                }
+            }
+        }
+    }
+
     /**
      * Return the underlying byte buffer. Use with care.
      *
@@ -1046,19 +1526,32 @@ public class NumpyArray
      */
     public Object toDoubleArray()
     {
+        // Fill in the 1D case directly, rather than via reflection, and
+        // only use Array.newInstance() for the multi-dimensional case
         int[] shape = shape();
-        Object rv = Array.newInstance(Double.TYPE, shape);
         if (shape.length == 1) {
-            for (int i = 0, size = shape[0]; i < size; i++) {
-                Array.set(rv, i, getDouble(i));
+            final double[] rv = new double[shape[0]];
+            if (myType == Type.FLOAT64 && myStrides[0] == Double.BYTES) {
+                // Contiguous data of the same type can be copied in bulk,
+                // which the JVM does with vectorised instructions, rather
+                // than one element at a time. The view inherits our byte
+                // order and does not disturb our buffer's position.
+                myByteBuffer.asDoubleBuffer().get(rv);
+            }
+            else {
+                for (int i = 0; i < rv.length; i++) {
+                    rv[i] = getDouble(i);
+                }
             }
+            return rv;
         }
         else {
-            for (int i = 0, size = shape[0]; i < size; i++) {
-                Array.set(rv, i, select(0, i).toDoubleArray());
+            final Object[] rv = (Object[])Array.newInstance(Double.TYPE, shape);
+            for (int i = 0; i < rv.length; i++) {
+                rv[i] = select(0, i).toDoubleArray();
             }
+            return rv;
         }
-        return rv;
     }
 
     /**
@@ -1069,19 +1562,27 @@ public class NumpyArray
      */
     public Object toIntArray()
     {
+        // See toDoubleArray() for why the 1D case is handled separately
         int[] shape = shape();
-        Object rv = Array.newInstance(Integer.TYPE, shape);
         if (shape.length == 1) {
-            for (int i = 0, size = shape[0]; i < size; i++) {
-                Array.set(rv, i, getInt(i));
+            final int[] rv = new int[shape[0]];
+            if (myType == Type.INT32 && myStrides[0] == Integer.BYTES) {
+                myByteBuffer.asIntBuffer().get(rv);
             }
+            else {
+                for (int i = 0; i < rv.length; i++) {
+                    rv[i] = getInt(i);
+                }
+            }
+            return rv;
         }
         else {
-            for (int i = 0, size = shape[0]; i < size; i++) {
-                Array.set(rv, i, select(0, i).toIntArray());
+            final Object[] rv = (Object[])Array.newInstance(Integer.TYPE, shape);
+            for (int i = 0; i < rv.length; i++) {
+                rv[i] = select(0, i).toIntArray();
             }
+            return rv;
         }
-        return rv;
     }
 
     /**
@@ -1092,19 +1593,27 @@ public class NumpyArray
      */
     public Object toLongArray()
     {
+        // See toDoubleArray() for why the 1D case is handled separately
         int[] shape = shape();
-        Object rv = Array.newInstance(Long.TYPE, shape);
         if (shape.length == 1) {
-            for (int i = 0, size = shape[0]; i < size; i++) {
-                Array.set(rv, i, getLong(i));
+            final long[] rv = new long[shape[0]];
+            if (myType == Type.INT64 && myStrides[0] == Long.BYTES) {
+                myByteBuffer.asLongBuffer().get(rv);
+            }
+            else {
+                for (int i = 0; i < rv.length; i++) {
+                    rv[i] = getLong(i);
+                }
             }
+            return rv;
         }
         else {
-            for (int i = 0, size = shape[0]; i < size; i++) {
-                Array.set(rv, i, select(0, i).toLongArray());
+            final Object[] rv = (Object[])Array.newInstance(Long.TYPE, shape);
+            for (int i = 0; i < rv.length; i++) {
+                rv[i] = select(0, i).toLongArray();
             }
+            return rv;
         }
-        return rv;
     }
 
     /**
@@ -1142,6 +1651,13 @@ public class NumpyArray
         myShape = shapeArray.clone();
         myNumDimensions = myShape.length;
 
+        // The shape never changes so we may compute the size up front
+        int size = 1;
+        for (int i = 0; i < myNumDimensions; i++) {
+            size = Math.multiplyExact(size, myShape[i]);
+        }
+        mySize = size;
+
         myType = myDType.type();
 
         // Setup strides
@@ -1166,5 +1682,6 @@ public class NumpyArray
         myByteBuffer = data.slice();
         myByteBuffer.order(myDType.bigEndian() ? ByteOrder.BIG_ENDIAN
                                                : ByteOrder.LITTLE_ENDIAN);
+        myBaseByteBuffer = myByteBuffer;
     }
 }
@@ -8,6 +8,11 @@ import java.io.OutputStream;
 
 import java.nio.ByteBuffer;
 import java.nio.ByteOrder;
+import java.nio.DoubleBuffer;
+import java.nio.FloatBuffer;
+import java.nio.IntBuffer;
+import java.nio.LongBuffer;
+import java.nio.ShortBuffer;
 import java.nio.charset.StandardCharsets;
 
 import java.util.Arrays;
@@ -18,6 +23,7 @@ import java.util.List;
 import java.util.Map;
 import java.util.Map.Entry;
 import java.util.RandomAccess;
+import java.util.function.BiConsumer;
 
 /**
  * Serialization of basic Java objects into a format compatible with Python's
@@ -28,6 +34,38 @@ import java.util.RandomAccess;
  */
 public class PythonPickle
 {
+    /**
+     * A {@link ByteArrayOutputStream} which may be grown up-front, when we know
+     * how much data is about to be written to it.
+     */
+    private static class PickleOutputStream
+        extends ByteArrayOutputStream
+    {
+        /**
+         * Ensure that at least the given number of bytes may be written
+         * without the underlying buffer needing to be grown.
+         */
+        public void ensureAvailable(final long n)
+        {
+            // If we can't fit it then we leave it to write() to complain
+            final long needed = count + n;
+            if (needed > buf.length && needed <= Integer.MAX_VALUE) {
+                buf = Arrays.copyOf(buf, (int)needed);
+            }
+        }
+
+        /**
+         * Get a view of the current contents of the stream, without copying
+         * them. This is only valid until the stream is next written to.
+         */
+        public ByteBuffer toByteBuffer()
+        {
+            return ByteBuffer.wrap(buf, 0, count);
+        }
+    }
+
+    // ----------------------------------------------------------------------
+
     // Keep in sync with pickle.Pickler._BATCHSIZE. This is how many elements
     // batch_list/dict() pumps out before doing APPENDS/SETITEMS. Nothing will
     // break if this gets out of sync with pickle.py, but it's unclear that
@@ -35,12 +73,43 @@ public class PythonPickle
     private static final int  BATCHSIZE = 1000;
     private static final byte MARK_V    = Operations.MARK.code;
 
+    // The size of the scratch buffer which we use for writing out arrays
+    private static final int BULK_BUFFER_SIZE = 64 * 1024;
+
+    /**
+     * How we save the final classes which we know about, keyed by their exact
+     * class. This means that save() can find the right method with a single
+     * lookup, instead of walking an {@code instanceof} chain.
+     */
+    private static final Map<Class<?>,BiConsumer<PythonPickle,Object>> SAVERS =
+        new IdentityHashMap<>();
+    static {
+        SAVERS.put(Boolean.class,
+                   (p, o) -> p.write(((Boolean) o) ? Operations.NEWTRUE
+                                                   : Operations.NEWFALSE));
+        SAVERS.put(Float.class,    (p, o) -> p.saveFloat  ((Float)   o));
+        SAVERS.put(Double.class,   (p, o) -> p.saveFloat  ((Double)  o));
+        SAVERS.put(Byte.class,     (p, o) -> p.saveInteger(((Byte)  o).intValue()));
+        SAVERS.put(Short.class,    (p, o) -> p.saveInteger(((Short) o).intValue()));
+        SAVERS.put(Integer.class,  (p, o) -> p.saveInteger((Integer) o));
+        SAVERS.put(Long.class,     (p, o) -> p.saveInteger((Long)    o));
+        SAVERS.put(String.class,   (p, o) -> p.saveUnicode((String)  o));
+        SAVERS.put(boolean[].class, (p, o) -> p.saveNumpyBooleanArray((boolean[]) o));
+        SAVERS.put(char[].class,    (p, o) -> p.saveNumpyCharArray   ((char[])    o));
+        SAVERS.put(byte[].class,    (p, o) -> p.saveNumpyByteArray   ((byte[])    o));
+        SAVERS.put(short[].class,   (p, o) -> p.saveNumpyShortArray  ((short[])   o));
+        SAVERS.put(int[].class,     (p, o) -> p.saveNumpyIntArray    ((int[])     o));
+        SAVERS.put(long[].class,    (p, o) -> p.saveNumpyLongArray   ((long[])    o));
+        SAVERS.put(float[].class,   (p, o) -> p.saveNumpyFloatArray  ((float[])   o));
+        SAVERS.put(double[].class,  (p, o) -> p.saveNumpyDoubleArray ((double[])  o));
+    }
+
     // ----------------------------------------------------------------------
 
     /**
      * We buffer up everything in here for dumping.
      */
-    private final ByteArrayOutputStream myStream = new ByteArrayOutputStream();
+    private final PickleOutputStream myStream = new PickleOutputStream();
 
     /**
      * Used to provide a handle on objects which we have already stored (so that
@@ -49,10 +118,18 @@ public class PythonPickle
     private final IdentityHashMap<Object,Integer> myMemo = new IdentityHashMap<>();
 
     // Scratch space
-    private final ByteBuffer myTwoByteBuffer   = ByteBuffer.allocate(2);
     private final ByteBuffer myFourByteBuffer  = ByteBuffer.allocate(4);
     private final ByteBuffer myEightByteBuffer = ByteBuffer.allocate(8);
-    private final ByteList   myByteList        = new ByteList();
+
+    // Scratch space for writing out arrays in bulk. The typed views all share
+    // the same little-endian backing array.
+    private final ByteBuffer   myBulkBuffer  =
+        ByteBuffer.allocate(BULK_BUFFER_SIZE).order(ByteOrder.LITTLE_ENDIAN);
+    private final ShortBuffer  myBulkShorts  = myBulkBuffer.asShortBuffer();
+    private final IntBuffer    myBulkInts    = myBulkBuffer.asIntBuffer();
+    private final LongBuffer   myBulkLongs   = myBulkBuffer.asLongBuffer();
+    private final FloatBuffer  myBulkFloats  = myBulkBuffer.asFloatBuffer();
+    private final DoubleBuffer myBulkDoubles = myBulkBuffer.asDoubleBuffer();
 
     // ----------------------------------------------------------------------
 
@@ -77,6 +154,18 @@ public class PythonPickle
         return myStream.toByteArray();
     }
 
+    /**
+     * Dump to a view of this instance's internal buffer. This avoids the copy
+     * which {@link #toByteArray(Object)} makes but the result is only valid
+     * until this instance is next used. The pickled data runs from the array
+     * start for {@code remaining()} bytes.
+     */
+    public ByteBuffer toByteBuffer(Object o)
+    {
+        toPickle(o);
+        return myStream.toByteBuffer();
+    }
+
     /**
      * Pickle an arbitrary object which isn't handled by default.
      *
@@ -197,11 +286,20 @@ public class PythonPickle
      */
     protected final void saveFloat(float o)
     {
-        myByteList.clear();
-        myByteList.append(Float.toString(o).getBytes());
+        // Small whole numbers are by far the most common values here. These
+        // are exact as doubles and their decimal form is exactly the integer,
+        // so Python would parse the text back to the very same double. We can
+        // therefore write them out as a binary double directly, rather than
+        // going via a string. (Beyond 2^24 a float's shortest decimal form
+        // need not be its exact value so we leave those to the general case.)
+        if (Math.abs(o) <= 0x1p24f && o == Math.rint(o)) {
+            saveFloat((double) o);
+            return;
+        }
 
+        // Write the text straight out, rather than staging a copy of it first
         write(Operations.FLOAT);
-        write(myByteList.toArray());
+        writeAscii(Float.toString(o));
         write((byte) '\n');
     }
 
@@ -309,8 +407,14 @@ public class PythonPickle
         final int n = o.length;
         writeBinStringHeader((long) n);
 
-        for (boolean d : o) {
-            write((byte) (d?1:0));
+        // Write these out in bulk, a buffer-full at a time
+        final byte[] bulk = myBulkBuffer.array();
+        for (int i=0; i < n; i += bulk.length) {
+            final int len = Math.min(bulk.length, n - i);
+            for (int j=0; j < len; j++) {
+                bulk[j] = (byte) (o[i + j] ? 1 : 0);
+            }
+            myStream.write(bulk, 0, len);
         }
 
         addNumpyArrayEnding(DType.Type.BOOLEAN, o);
@@ -325,9 +429,8 @@ public class PythonPickle
         final int n = o.length;
         writeBinStringHeader((long) n);
 
-        for (byte d : o) {
-            write(d);
-        }
+        // These are already in the right form
+        myStream.write(o, 0, n);
 
         addNumpyArrayEnding(DType.Type.INT8, o);
     }
@@ -341,8 +444,15 @@ public class PythonPickle
         final int n = o.length;
         writeBinStringHeader((long) n);
 
-        for (char c : o) {
-            write(c);
+        // Write these out in bulk, a buffer-full at a time. Like write(char),
+        // we only keep the low byte of each.
+        final byte[] bulk = myBulkBuffer.array();
+        for (int i=0; i < n; i += bulk.length) {
+            final int len = Math.min(bulk.length, n - i);
+            for (int j=0; j < len; j++) {
+                bulk[j] = (byte) o[i + j];
+            }
+            myStream.write(bulk, 0, len);
         }
 
         addNumpyArrayEnding(DType.Type.CHAR, o);
@@ -357,9 +467,8 @@ public class PythonPickle
         final int n = o.size();
         writeBinStringHeader((long) n);
 
-        for (int i=0; i < n; ++i) {
-            write(o.getNoCheck(i));
-        }
+        // Write these straight out of the list's backing array
+        myStream.write(o.getArray(), 0, n);
 
         addNumpyArrayEnding(DType.Type.INT8, o);
     }
@@ -372,10 +481,14 @@ public class PythonPickle
         saveGlobal("numpy", "fromstring");
         final int n = o.length;
         writeBinStringHeader(2 * (long) n);
-        myTwoByteBuffer.order(ByteOrder.LITTLE_ENDIAN);
 
-        for (short d : o) {
-            write(myTwoByteBuffer.putShort(0, d));
+        // Write these out in bulk, a buffer-full at a time
+        final int chunk = myBulkShorts.capacity();
+        for (int i=0; i < n; i += chunk) {
+            final int len = Math.min(chunk, n - i);
+            myBulkShorts.clear();
+            myBulkShorts.put(o, i, len);
+            myStream.write(myBulkBuffer.array(), 0, len * Short.BYTES);
         }
 
         addNumpyArrayEnding(DType.Type.INT16, o);
@@ -389,10 +502,14 @@ public class PythonPickle
         saveGlobal("numpy", "fromstring");
         final int n = o.length;
         writeBinStringHeader(4 * (long) n);
-        myFourByteBuffer.order(ByteOrder.LITTLE_ENDIAN);
 
-        for (int d : o) {
-            write(myFourByteBuffer.putInt(0, d));
+        // Write these out in bulk, a buffer-full at a time
+        final int chunk = myBulkInts.capacity();
+        for (int i=0; i < n; i += chunk) {
+            final int len = Math.min(chunk, n - i);
+            myBulkInts.clear();
+            myBulkInts.put(o, i, len);
+            myStream.write(myBulkBuffer.array(), 0, len * Integer.BYTES);
         }
 
         addNumpyArrayEnding(DType.Type.INT32, o);
@@ -406,10 +523,14 @@ public class PythonPickle
         saveGlobal("numpy", "fromstring");
         final int n = o.length;
         writeBinStringHeader(8 * (long) n);
-        myEightByteBuffer.order(ByteOrder.LITTLE_ENDIAN);
 
-        for (long d : o) {
-            write(myEightByteBuffer.putLong(0, d));
+        // Write these out in bulk, a buffer-full at a time
+        final int chunk = myBulkLongs.capacity();
+        for (int i=0; i < n; i += chunk) {
+            final int len = Math.min(chunk, n - i);
+            myBulkLongs.clear();
+            myBulkLongs.put(o, i, len);
+            myStream.write(myBulkBuffer.array(), 0, len * Long.BYTES);
         }
 
         addNumpyArrayEnding(DType.Type.INT64, o);
@@ -423,10 +544,14 @@ public class PythonPickle
         saveGlobal("numpy", "fromstring");
         final int n = o.length;
         writeBinStringHeader(4 * (long) n);
-        myFourByteBuffer.order(ByteOrder.LITTLE_ENDIAN);
 
-        for (float f : o) {
-            write(myFourByteBuffer.putFloat(0, f));
+        // Write these out in bulk, a buffer-full at a time
+        final int chunk = myBulkFloats.capacity();
+        for (int i=0; i < n; i += chunk) {
+            final int len = Math.min(chunk, n - i);
+            myBulkFloats.clear();
+            myBulkFloats.put(o, i, len);
+            myStream.write(myBulkBuffer.array(), 0, len * Float.BYTES);
         }
 
         addNumpyArrayEnding(DType.Type.FLOAT32, o);
@@ -440,10 +565,14 @@ public class PythonPickle
         saveGlobal("numpy", "fromstring");
         final int n = o.length;
         writeBinStringHeader(8 * (long) n);
-        myEightByteBuffer.order(ByteOrder.LITTLE_ENDIAN);
 
-        for (double d : o) {
-            write(myEightByteBuffer.putDouble(0, d));
+        // Write these out in bulk, a buffer-full at a time
+        final int chunk = myBulkDoubles.capacity();
+        for (int i=0; i < n; i += chunk) {
+            final int len = Math.min(chunk, n - i);
+            myBulkDoubles.clear();
+            myBulkDoubles.put(o, i, len);
+            myStream.write(myBulkBuffer.array(), 0, len * Double.BYTES);
         }
 
         addNumpyArrayEnding(DType.Type.FLOAT64, o);
@@ -473,59 +602,17 @@ public class PythonPickle
     private void save(Object o)
         throws UnsupportedOperationException
     {
+        final BiConsumer<PythonPickle,Object> saver;
         if (o == null) {
             write(Operations.NONE);
         }
         else if (myMemo.containsKey(o)) {
             get(o);
         }
-        else if (o instanceof Boolean) {
-            write(((Boolean) o) ? Operations.NEWTRUE : Operations.NEWFALSE);
-        }
-        else if (o instanceof Float) {
-            saveFloat((Float) o);
-        }
-        else if (o instanceof Double) {
-            saveFloat((Double) o);
-        }
-        else if (o instanceof Byte) {
-            saveInteger(((Byte) o).intValue());
-        }
-        else if (o instanceof Short) {
-            saveInteger(((Short) o).intValue());
-        }
-        else if (o instanceof Integer) {
-            saveInteger((Integer) o);
-        }
-        else if (o instanceof Long) {
-            saveInteger((Long) o);
-        }
-        else if (o instanceof String) {
-            saveUnicode((String) o);
-        }
-        else if (o instanceof boolean[]) {
-            saveNumpyBooleanArray((boolean[]) o);
-        }
-        else if (o instanceof char[]) {
-            saveNumpyCharArray((char[]) o);
-        }
-        else if (o instanceof byte[]) {
-            saveNumpyByteArray((byte[]) o);
-        }
-        else if (o instanceof short[]) {
-            saveNumpyShortArray((short[]) o);
-        }
-        else if (o instanceof int[]) {
-            saveNumpyIntArray((int[]) o);
-        }
-        else if (o instanceof long[]) {
-            saveNumpyLongArray((long[]) o);
-        }
-        else if (o instanceof float[]) {
-            saveNumpyFloatArray((float[]) o);
-        }
-        else if (o instanceof double[]) {
-            saveNumpyDoubleArray((double[]) o);
+        else if ((saver = SAVERS.get(o.getClass())) != null) {
+            // All the types in the table are final so an exact class match
+            // is the same as an instanceof check
+            saver.accept(this, o);
         }
         else if (o instanceof List) {
             saveList((List<Object>) o);
@@ -557,6 +644,11 @@ public class PythonPickle
             write(Operations.BINSTRING);
             // Pickle protocol is always little-endian
             writeLittleEndianInt((int) n);
+
+            // We know exactly how much data is coming so size the stream for
+            // it now, rather than having it grow (and copy) repeatedly as the
+            // data is written
+            myStream.ensureAvailable(n);
         }
         else {
             throw new UnsupportedOperationException("String length of " + n + " is too large");
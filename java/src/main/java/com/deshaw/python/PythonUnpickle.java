@@ -621,6 +621,17 @@ public class PythonUnpickle
             }
         };
 
+    /**
+     * Stands in for a {@code null} in {@link #myMemo}, where a {@code null}
+     * entry means that there is nothing stored under that key.
+     */
+    private static final Object NULL_MEMO_VALUE =
+        new Object() {
+            @Override public String toString() {
+                return "<NULL>";
+            }
+        };
+
     /**
      * Stream where we read pickle data from.
      */
@@ -632,9 +643,18 @@ public class PythonUnpickle
     private final ShrinkableList<Object> myStack = new ShrinkableList<>();
 
     /**
-     * Memo (objects indexed by integers).
+     * Memo (objects indexed by integers). Python numbers its memo entries
+     * sequentially from zero so we hold them in an array, indexed by key,
+     * rather than boxing every key for a map lookup. Keys which are negative,
+     * or which are too far past the end of the array to grow it to, go into
+     * {@link #mySparseMemo} instead.
      */
-    private final Map<Integer,Object> myMemo = new HashMap<>();
+    private Object[] myMemo = new Object[16];
+
+    /**
+     * Memo entries whose keys don't fit into {@link #myMemo}.
+     */
+    private final Map<Integer,Object> mySparseMemo = new HashMap<>();
 
     // ----------------------------------------------------------------------
 
@@ -810,7 +830,7 @@ public class PythonUnpickle
                 case PUT: {
                     String repr = readline();
                     try {
-                        myMemo.put(Integer.parseInt(repr), peek());
+                        memoPut(Integer.parseInt(repr), peek());
                     }
                     catch (NumberFormatException e) {
                         throw new MalformedPickleException(
@@ -822,11 +842,11 @@ public class PythonUnpickle
                 }
 
                 case BINPUT:
-                    myMemo.put(read(), peek());
+                    memoPut(read(), peek());
                     break;
 
                 case LONG_BINPUT:
-                    myMemo.put(readInt32(), peek());
+                    memoPut(readInt32(), peek());
                     break;
 
                 case GET: {
@@ -1186,12 +1206,40 @@ public class PythonUnpickle
      */
     private void memoGet(int key) throws MalformedPickleException
     {
-        if (!myMemo.containsKey(key)) {
+        final Object value;
+        if (0 <= key && key < myMemo.length && myMemo[key] != null) {
+            value = (myMemo[key] == NULL_MEMO_VALUE) ? null : myMemo[key];
+        }
+        else if (mySparseMemo.containsKey(key)) {
+            value = mySparseMemo.get(key);
+        }
+        else {
             throw new MalformedPickleException(
                 "GET key " + key + " missing from the memo"
             );
         }
-        myStack.add(myMemo.get(key));
+        myStack.add(value);
+    }
+
+    /**
+     * Store a memo object under the given key.
+     */
+    private void memoPut(int key, Object value)
+    {
+        // We only grow the array by doubling it, so that a bogus key can't
+        // make us allocate a huge one
+        if (key >= myMemo.length && key < 2 * myMemo.length) {
+            myMemo = Arrays.copyOf(myMemo, 2 * myMemo.length);
+        }
+
+        if (0 <= key && key < myMemo.length) {
+            // Any stale sparse entry for this key is shadowed by this one,
+            // since memoGet() looks here first
+            myMemo[key] = (value == null) ? NULL_MEMO_VALUE : value;
+        }
+        else {
+            mySparseMemo.put(key, value);
+        }
     }
 
     /**
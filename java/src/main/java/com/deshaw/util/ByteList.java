@@ -3,6 +3,7 @@ package com.deshaw.util;
 import java.io.DataInput;
 import java.io.DataOutput;
 import java.io.IOException;
+import java.io.InputStream;
 import java.io.OutputStream;
 
 import java.nio.ByteBuffer;
@@ -235,6 +236,18 @@ public class ByteList
         return myData[index];
     }
 
+    /**
+     * Get the array which backs this list. Use with care: only the first
+     * {@link #size()} elements are meaningful and this will stop being the
+     * backing array if the list subsequently grows.
+     *
+     * @return the array backing this list.
+     */
+    public byte[] getArray()
+    {
+        return myData;
+    }
+
     /**
      * Give back (a possible) copy of the data held by this class. Mutating the
      * results of this method may result in undefined behaviour.
@@ -352,6 +365,43 @@ public class ByteList
         return appendNoCheck(data, offset, len);
     }
 
+    /**
+     * Reads up to {@code len} bytes from the given stream, appending them
+     * directly onto the end of this list.
+     *
+     * <p>This avoids the need to read into an intermediate buffer and then
+     * copy that into the list.
+     *
+     * @param  in   the stream to read from
+     * @param  len  the maximum number of bytes to read
+     *
+     * @return the number of bytes read, or {@code -1} if the end of the stream
+     *         has been reached
+     *
+     * @throws IOException              if there was a problem reading from the
+     *                                  stream.
+     * @throws IllegalArgumentException if {@code len} is negative.
+     */
+    public int read(final InputStream in, final int len)
+        throws IOException,
+               IllegalArgumentException
+    {
+        if (len < 0) {
+            throw new IllegalArgumentException("Negative length: " + len);
+        }
+
+        // Make sure that there is room for it all and read it directly into
+        // our array
+        ensureCapacity(mySize + len);
+        final int read = in.read(myData, mySize, len);
+        if (read > 0) {
+            mySize += read;
+            myToString = null;
+        }
+
+        return read;
+    }
+
     /**
      * Remove all the entries from this list.
      */
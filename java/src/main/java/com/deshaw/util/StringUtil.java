@@ -299,6 +299,11 @@ public class StringUtil
             // above.
             return false;
         }
+        else if (a instanceof String && b instanceof String) {
+            // String's own equals() is intrinsified by the JVM and so is
+            // faster than our walk below
+            return a.equals(b);
+        }
         else if (a.length() != b.length()) {
             // Different lengths implies not identical.
             return false;
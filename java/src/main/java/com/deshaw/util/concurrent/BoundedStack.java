@@ -0,0 +1,109 @@
+package com.deshaw.util.concurrent;
+
+import java.util.Objects;
+import java.util.concurrent.ConcurrentLinkedDeque;
+import java.util.concurrent.atomic.AtomicInteger;
+
+/**
+ * A last-in-first-out stack which holds at most a given number of elements.
+ *
+ * <p>The bound is exact. Each {@link #offer(Object)} reserves its slot in the
+ * count before pushing its element and each {@link #poll()} claims an element
+ * from the count before popping it. An offer is therefore only ever rejected
+ * when the stack is truly full.
+ *
+ * <p>The count includes elements whose offers have reserved their slot but not
+ * yet pushed them. A {@link #poll()} which claims such an element spins until
+ * that push lands, so it may wait on another thread. This is intended for
+ * small pools, such as that of a connection's idle workers, where that window
+ * is a handful of instructions.
+ *
+ * @param <T> The type of the elements.
+ */
+public class BoundedStack<T>
+{
+    /**
+     * The elements, most recently pushed first.
+     */
+    private final ConcurrentLinkedDeque<T> myElements;
+
+    /**
+     * How many elements are in the stack, or are about to be pushed onto it,
+     * and not yet claimed. The deque's own size() is not constant-time so we
+     * track it ourselves.
+     */
+    private final AtomicInteger mySize;
+
+    /**
+     * The most elements that we will hold.
+     */
+    private final int myCapacity;
+
+    /**
+     * Constructor.
+     *
+     * @param capacity  The most elements that the stack will hold.
+     */
+    public BoundedStack(final int capacity)
+    {
+        myElements = new ConcurrentLinkedDeque<>();
+        mySize     = new AtomicInteger(0);
+        myCapacity = capacity;
+    }
+
+    /**
+     * Push an element onto the stack, if there is room for it.
+     *
+     * @param element  The element to push. This may not be {@code null}.
+     *
+     * @return whether the element was pushed; it will not be if the stack is
+     *         already full.
+     *
+     * @throws NullPointerException if the element is {@code null}.
+     */
+    public boolean offer(final T element)
+        throws NullPointerException
+    {
+        // Check this before reserving a slot, since a reservation which is
+        // never filled would leave a later poll() spinning forever
+        Objects.requireNonNull(element);
+
+        // Reserve our slot first so that we never exceed the bound
+        if (mySize.incrementAndGet() > myCapacity) {
+            mySize.decrementAndGet();
+            return false;
+        }
+        myElements.push(element);
+        return true;
+    }
+
+    /**
+     * Pop the most recently pushed element from the stack. If the element
+     * which we claim is still being pushed by another thread's
+     * {@link #offer(Object)} then we spin until it lands.
+     *
+     * @return the element, or {@code null} if there are none.
+     */
+    public T poll()
+    {
+        // Claim an element first, if there are any to claim
+        int size;
+        do {
+            size = mySize.get();
+            if (size <= 0) {
+                return null;
+            }
+        } while (!mySize.compareAndSet(size, size - 1));
+
+        // The element which we claimed might belong to an offer() which has
+        // reserved its slot but not yet pushed it. That push is imminent so we
+        // just wait for it.
+        while (true) {
+            final T element = myElements.poll();
+            if (element != null) {
+                return element;
+            }
+            Thread.onSpinWait();
+        }
+    }
+}
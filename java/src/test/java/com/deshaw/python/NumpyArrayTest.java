@@ -0,0 +1,455 @@
+package com.deshaw.python;
+
+import com.deshaw.python.DType;
+import com.deshaw.python.NumpyArray;
+
+import org.junit.jupiter.api.Test;
+
+import static org.junit.jupiter.api.Assertions.assertArrayEquals;
+import static org.junit.jupiter.api.Assertions.assertEquals;
+import static org.junit.jupiter.api.Assertions.assertNotSame;
+import static org.junit.jupiter.api.Assertions.assertSame;
+import static org.junit.jupiter.api.Assertions.assertThrows;
+import static org.junit.jupiter.api.Assertions.assertTrue;
+
+/**
+ * A unit test suite for testing {@link com.deshaw.python.NumpyArray}.
+ */
+public class NumpyArrayTest
+{
+    /**
+     * The dtypes which we test with.
+     */
+    private static final DType BOOL    = new DType("|b1");
+    private static final DType FLOAT32 = new DType("<f4");
+    private static final DType FLOAT64 = new DType("<f8");
+    private static final DType INT16   = new DType("<i2");
+    private static final DType INT32   = new DType("<i4");
+
+    // ----------------------------------------------------------------------
+
+    /**
+     * Rolling an axis towards the end moves its shape and strides, as
+     * numpy's {@code moveaxis} does, and gives a view onto the same data.
+     */
+    @Test
+    public void testRollAxisForwards()
+    {
+        final NumpyArray array  = filled(FLOAT64, false, 2, 3, 4);
+        final NumpyArray rolled = array.rollAxis(0, 2);
+
+        assertArrayEquals(new int[] { 3, 4, 2 }, rolled.shape());
+        for (int i = 0; i < 2; i++) {
+            for (int j = 0; j < 3; j++) {
+                for (int k = 0; k < 4; k++) {
+                    assertEquals(array ._double(array .ix(i, j, k)),
+                                 rolled._double(rolled.ix(j, k, i)));
+                }
+            }
+        }
+    }
+
+    /**
+     * Rolling an axis towards the start moves its shape and strides, as
+     * numpy's {@code moveaxis} does, and gives a view onto the same data.
+     */
+    @Test
+    public void testRollAxisBackwards()
+    {
+        final NumpyArray array  = filled(FLOAT64, false, 2, 3, 4);
+        final NumpyArray rolled = array.rollAxis(2, 0);
+
+        assertArrayEquals(new int[] { 4, 2, 3 }, rolled.shape());
+        for (int i = 0; i < 2; i++) {
+            for (int j = 0; j < 3; j++) {
+                for (int k = 0; k < 4; k++) {
+                    assertEquals(array ._double(array .ix(i, j, k)),
+                                 rolled._double(rolled.ix(k, i, j)));
+                }
+            }
+        }
+
+        // Rolling by one towards the start of a 2D array transposes it
+        final NumpyArray matrix     = filled(FLOAT64, false, 2, 3);
+        final NumpyArray transposed = matrix.rollAxis(1, 0);
+        assertArrayEquals(new int[] { 3, 2 }, transposed.shape());
+        for (int r = 0; r < 2; r++) {
+            for (int c = 0; c < 3; c++) {
+                assertEquals(matrix    ._double(matrix    .ix(r, c)),
+                             transposed._double(transposed.ix(c, r)));
+            }
+        }
+    }
+
+    /**
+     * Rolling an axis onto itself gives back the same array.
+     */
+    @Test
+    public void testRollAxisIdentity()
+    {
+        final NumpyArray array = filled(FLOAT64, false, 2, 3, 4);
+        for (int axis = 0; axis < 3; axis++) {
+            assertSame(array, array.rollAxis(axis, axis));
+        }
+    }
+
+    /**
+     * Rolling from, or to, an axis which doesn't exist is an error.
+     */
+    @Test
+    public void testRollAxisBounds()
+    {
+        final NumpyArray array = filled(FLOAT64, false, 2, 3, 4);
+        assertThrows(IllegalArgumentException.class, () -> array.rollAxis(-1,  0));
+        assertThrows(IllegalArgumentException.class, () -> array.rollAxis( 3,  0));
+        assertThrows(IllegalArgumentException.class, () -> array.rollAxis( 0, -1));
+        assertThrows(IllegalArgumentException.class, () -> array.rollAxis( 0,  3));
+    }
+
+    /**
+     * Slicing the whole of a dimension gives back the same array.
+     */
+    @Test
+    public void testSliceFullRange()
+    {
+        final NumpyArray array = filled(FLOAT64, false, 3, 4);
+        assertSame(array, array.slice(0, 0, 3));
+        assertSame(array, array.slice(1, 0, 4));
+    }
+
+    /**
+     * Slicing part of a dimension gives a new view, of the sliced shape, onto
+     * the same data.
+     */
+    @Test
+    public void testSlicePartialRange()
+    {
+        final NumpyArray array = filled(FLOAT64, false, 3, 4);
+
+        final NumpyArray rows = array.slice(0, 1, 3);
+        assertNotSame(array, rows);
+        assertArrayEquals(new int[] { 2, 4 }, rows.shape());
+        for (int r = 0; r < 2; r++) {
+            for (int c = 0; c < 4; c++) {
+                assertEquals(array._double(array.ix(r + 1, c)),
+                             rows ._double(rows .ix(r,     c)));
+            }
+        }
+
+        final NumpyArray cols = array.slice(1, 1, 2);
+        assertNotSame(array, cols);
+        assertArrayEquals(new int[] { 3, 1 }, cols.shape());
+        for (int r = 0; r < 3; r++) {
+            assertEquals(array._double(array.ix(r, 1)),
+                         cols ._double(cols .ix(r, 0)));
+        }
+    }
+
+    /**
+     * Copying a view of whole rows of a C-ordered array, whose strides match
+     * those of a new array of its shape, copies just that view's data. This
+     * takes the bulk copy path in {@link NumpyArray#asType}.
+     */
+    @Test
+    public void testAsTypeRowSlice()
+    {
+        final NumpyArray array = filled(FLOAT64, false, 4, 5);
+        final NumpyArray view  = array.slice(0, 1, 3);
+        final NumpyArray copy  = view.asType(FLOAT64, true, false, false);
+
+        assertArrayEquals(new int[] { 2, 5 }, copy.shape());
+        assertElementsEqual(view, copy);
+
+        // It should be a copy, not another view
+        array.set(array.ix(1, 0), -1.0);
+        assertEquals(5.0, copy._double(copy.ix(0, 0)));
+    }
+
+    /**
+     * Copying a view of some of the columns of a C-ordered array, whose strides
+     * do not match those of a new array of its shape, converts it element by
+     * element. This does not take the bulk copy path in
+     * {@link NumpyArray#asType}.
+     */
+    @Test
+    public void testAsTypeColumnSlice()
+    {
+        final NumpyArray array = filled(FLOAT64, false, 4, 5);
+        final NumpyArray view  = array.slice(1, 1, 3);
+        final NumpyArray copy  = view.asType(FLOAT64, true, false, false);
+
+        assertArrayEquals(new int[] { 4, 2 }, copy.shape());
+        assertElementsEqual(view, copy);
+
+        array.set(array.ix(0, 1), -1.0);
+        assertEquals(1.0, copy._double(copy.ix(0, 0)));
+    }
+
+    /**
+     * Copying into a direct buffer gives one whose data starts on a cache line
+     * boundary, with the same values, whether or not the type and layout are
+     * changed.
+     */
+    @Test
+    public void testAsTypeDirectAlignment()
+    {
+        final NumpyArray src = filled(FLOAT64, false, 7, 9);
+        for (DType dtype : new DType[] { FLOAT64, FLOAT32, INT32, INT16 }) {
+            for (boolean isFortran : new boolean[] { false, true }) {
+                final NumpyArray copy = src.asType(dtype, true, isFortran, true);
+                assertTrue  (copy.getByteBuffer().isDirect());
+                assertEquals(0, copy.getByteBuffer().alignmentOffset(0, 64));
+                assertElementsEqual(src, copy);
+            }
+        }
+    }
+
+    /**
+     * Copying into an array of the same shape and type gives the same values.
+     */
+    @Test
+    public void testCopyInto()
+    {
+        final NumpyArray src = filled(FLOAT64, false, 3, 4);
+        final NumpyArray dst = NumpyArray.zeros(FLOAT64, false, 3, 4);
+        assertSame(dst, src.copyInto(dst));
+        assertElementsEqual(src, dst);
+    }
+
+    /**
+     * Copying into an array of a different shape is an error.
+     */
+    @Test
+    public void testCopyIntoShapeMismatch()
+    {
+        final NumpyArray src = filled(FLOAT64, false, 3, 4);
+        assertThrows(IllegalArgumentException.class,
+                     () -> src.copyInto(NumpyArray.zeros(FLOAT64, false, 4, 3)));
+        assertThrows(IllegalArgumentException.class,
+                     () -> src.copyInto(NumpyArray.zeros(FLOAT64, false, 12)));
+    }
+
+    /**
+     * Copying into an array of a different type converts the values.
+     */
+    @Test
+    public void testCopyIntoConvertsType()
+    {
+        final NumpyArray src = filled(FLOAT64, false, 3, 4);
+        src.set(src.ix(2, 3), 11.75);
+
+        final NumpyArray dst = NumpyArray.zeros(INT32, false, 3, 4);
+        src.copyInto(dst);
+        for (int r = 0; r < 3; r++) {
+            for (int c = 0; c < 4; c++) {
+                assertEquals((long)(r * 4 + c), dst._long(dst.ix(r, c)));
+            }
+        }
+
+        // And back again
+        final NumpyArray back = NumpyArray.zeros(FLOAT32, false, 3, 4);
+        dst.copyInto(back);
+        assertElementsEqual(dst, back);
+    }
+
+    /**
+     * Copying a C-ordered array into a Fortran-ordered one keeps each element
+     * at the same indices.
+     */
+    @Test
+    public void testCopyIntoFortran()
+    {
+        final NumpyArray src = filled(FLOAT64, false, 3, 4);
+        final NumpyArray dst = NumpyArray.zeros(FLOAT64, true, 3, 4);
+        src.copyInto(dst);
+        assertElementsEqual(src, dst);
+
+        // The data should be laid out by column
+        assertEquals(4.0, dst.getByteBuffer().getDouble(1 * Double.BYTES));
+    }
+
+    /**
+     * Copying an array into a view of its own data, which overlaps it, gives
+     * the same result as copying it into a separate array would.
+     */
+    @Test
+    public void testCopyIntoAliased()
+    {
+        // Shift the elements along by one
+        final NumpyArray array = filled(FLOAT64, false, 10);
+        array.slice(0, 0, 9).copyInto(array.slice(0, 1, 10));
+        assertEquals(0.0, array._double(array.ix(0)));
+        for (int i = 1; i < 10; i++) {
+            assertEquals((double)(i - 1), array._double(array.ix(i)));
+        }
+
+        // Transpose a square array in place
+        final NumpyArray square = filled(FLOAT64, false, 5, 5);
+        square.copyInto(square.rollAxis(0, 1));
+        for (int r = 0; r < 5; r++) {
+            for (int c = 0; c < 5; c++) {
+                assertEquals((double)(c * 5 + r), square._double(square.ix(r, c)));
+            }
+        }
+    }
+
+    /**
+     * Copying a 2D array which is large enough to be copied in parallel, while
+     * changing both its type and its layout, gets every element right. The
+     * shape is not a multiple of the tile size so that the edge tiles are
+     * partial ones.
+     */
+    @Test
+    public void testCopyIntoParallel2d()
+    {
+        final int rows = 1024;
+        final int cols = 1025;
+        final NumpyArray src = filled(FLOAT64, false, rows, cols);
+        final NumpyArray dst = NumpyArray.zeros(FLOAT32, true, rows, cols);
+        assertSame(dst, src.copyInto(dst, true));
+
+        for (int r = 0; r < rows; r++) {
+            for (int c = 0; c < cols; c++) {
+                assertEquals((double)(r * cols + c), dst._double(dst.ix(r, c)));
+            }
+        }
+    }
+
+    /**
+     * Copying a 1D array which is large enough to be copied in parallel, while
+     * changing its type, gets every element right. The length is not a
+     * multiple of the chunk size so that the last chunk is a partial one.
+     */
+    @Test
+    public void testCopyIntoParallel1d()
+    {
+        final int n = (1 << 20) + 3;
+        final NumpyArray src = filled(FLOAT64, false, n);
+        final NumpyArray dst = NumpyArray.zeros(INT32, false, n);
+        assertSame(dst, src.copyInto(dst, true));
+
+        for (int i = 0; i < n; i++) {
+            assertEquals((long)i, dst._long(dst.ix(i)));
+        }
+    }
+
+    /**
+     * Copying a 2D array into one of the same type moves each element's bytes
+     * unchanged, for each width of element and each pair of layouts. The
+     * shape is not a multiple of the tile size in either dimension so that the
+     * edge tiles are partial ones.
+     */
+    @Test
+    public void testCopyIntoSameType()
+    {
+        final int rows = 37;
+        final int cols = 45;
+        for (DType dtype : new DType[] { FLOAT64, FLOAT32, INT16, BOOL }) {
+            for (boolean srcIsFortran : new boolean[] { false, true }) {
+                for (boolean dstIsFortran : new boolean[] { false, true }) {
+                    final NumpyArray src =
+                        rawFilled(dtype, srcIsFortran, rows, cols);
+                    final NumpyArray dst =
+                        NumpyArray.zeros(dtype, dstIsFortran, rows, cols);
+                    assertSame(dst, src.copyInto(dst));
+                    assertBytesEqual(src, dst);
+                }
+            }
+        }
+    }
+
+    // ----------------------------------------------------------------------
+
+    /**
+     * Assert that two 2D arrays of the same type have the same shape and that
+     * their elements have the same bytes.
+     */
+    private static void assertBytesEqual(final NumpyArray expected,
+                                         final NumpyArray actual)
+    {
+        assertEquals     (expected.dtype(), actual.dtype());
+        assertArrayEquals(expected.shape(), actual.shape());
+
+        final int size = expected.dtype().size();
+        for (int r = 0; r < expected.shape()[0]; r++) {
+            for (int c = 0; c < expected.shape()[1]; c++) {
+                final int expectedIx = expected.ix(r, c);
+                final int actualIx   = actual  .ix(r, c);
+                for (int b = 0; b < size; b++) {
+                    assertEquals(
+                        expected.getByteBuffer().get(expectedIx + b),
+                        actual  .getByteBuffer().get(actualIx   + b),
+                        "Byte " + b + " of [" + r + ", " + c + "] " +
+                        "of " + expected.dtype()
+                    );
+                }
+            }
+        }
+    }
+
+    /**
+     * Create a 2D array of the given type, layout and shape whose elements
+     * have distinct bytes. Booleans alternate between false and true instead,
+     * so that they stay valid.
+     */
+    private static NumpyArray rawFilled(final DType   dtype,
+                                        final boolean isFortran,
+                                        final int     rows,
+                                        final int     cols)
+    {
+        final NumpyArray array = NumpyArray.zeros(dtype, isFortran, rows, cols);
+        final int size = dtype.size();
+        int n = 0;
+        for (int r = 0; r < rows; r++) {
+            for (int c = 0; c < cols; c++, n++) {
+                final int ix = array.ix(r, c);
+                for (int b = 0; b < size; b++) {
+                    array.getByteBuffer().put(
+                        ix + b,
+                        dtype.equals(BOOL) ? (byte)(n & 1)
+                                           : (byte)(n * size + b)
+                    );
+                }
+            }
+        }
+        return array;
+    }
+
+    /**
+     * Assert that two 2D arrays have the same shape and that their elements
+     * have the same values.
+     */
+    private static void assertElementsEqual(final NumpyArray expected,
+                                            final NumpyArray actual)
+    {
+        assertArrayEquals(expected.shape(), actual.shape());
+        for (int r = 0; r < expected.shape()[0]; r++) {
+            for (int c = 0; c < expected.shape()[1]; c++) {
+                assertEquals(expected._double(expected.ix(r, c)),
+                             actual  ._double(actual  .ix(r, c)));
+            }
+        }
+    }
+
+    /**
+     * Create an array of the given type, layout and shape whose elements are
+     * numbered from zero, in C order.
+     */
+    private static NumpyArray filled(final DType   dtype,
+                                     final boolean isFortran,
+                                     final int...  shape)
+    {
+        final NumpyArray array = NumpyArray.zeros(dtype, isFortran, shape);
+        final int[] ixs = new int[shape.length];
+        for (int n = 0; n < array.size(); n++) {
+            // Turn the element number into its indices, in C order
+            int rest = n;
+            for (int dim = shape.length - 1; dim >= 0; dim--) {
+                ixs[dim] = rest % shape[dim];
+                rest    /= shape[dim];
+            }
+            array.set(array.ix(ixs), (double)n);
+        }
+        return array;
+    }
+}
@@ -0,0 +1,113 @@
+package com.deshaw.util.concurrent;
+
+import com.deshaw.util.concurrent.BoundedStack;
+
+import java.util.ArrayList;
+import java.util.List;
+import java.util.concurrent.atomic.AtomicInteger;
+
+import org.junit.jupiter.api.Test;
+
+import static org.junit.jupiter.api.Assertions.assertEquals;
+import static org.junit.jupiter.api.Assertions.assertFalse;
+import static org.junit.jupiter.api.Assertions.assertNotNull;
+import static org.junit.jupiter.api.Assertions.assertNull;
+import static org.junit.jupiter.api.Assertions.assertSame;
+import static org.junit.jupiter.api.Assertions.assertThrows;
+import static org.junit.jupiter.api.Assertions.assertTrue;
+
+/**
+ * Test the BoundedStack class for correctness.
+ */
+public class BoundedStackTest
+{
+    /**
+     * Ensure that the stack is LIFO and that its bound is enforced.
+     */
+    @Test
+    public void testOfferPoll()
+    {
+        final BoundedStack<String> stack = new BoundedStack<>(2);
+        assertNull(stack.poll());
+
+        assertTrue (stack.offer("a"));
+        assertTrue (stack.offer("b"));
+        assertFalse(stack.offer("c"));
+
+        assertSame("b", stack.poll());
+        assertTrue (stack.offer("d"));
+        assertSame("d", stack.poll());
+        assertSame("a", stack.poll());
+        assertNull(stack.poll());
+    }
+
+    /**
+     * Ensure that offering null is rejected without using up a slot.
+     */
+    @Test
+    public void testOfferNull()
+    {
+        final BoundedStack<String> stack = new BoundedStack<>(1);
+        assertThrows(NullPointerException.class, () -> stack.offer(null));
+        assertNull(stack.poll());
+
+        assertTrue (stack.offer("a"));
+        assertSame("a", stack.poll());
+    }
+
+    /**
+     * Ensure that, when many threads are taking elements and putting them
+     * back, none is ever turned away while the stack is below its capacity,
+     * and none is ever missing when one should be there. This is how the
+     * PJRmi connection uses it for its idle workers.
+     */
+    @Test
+    public void testConcurrentOfferPoll()
+        throws InterruptedException
+    {
+        final int numThreads    = 4;
+        final int numIterations = 100_000;
+
+        // As many elements as threads. Each thread holds at most one at a
+        // time so there's always one for it to take, and always room for it
+        // to give it back.
+        final BoundedStack<Object> stack = new BoundedStack<>(numThreads);
+        for (int i = 0; i < numThreads; i++) {
+            assertTrue(stack.offer(new Object()));
+        }
+
+        final AtomicInteger numMissing  = new AtomicInteger();
+        final AtomicInteger numRejected = new AtomicInteger();
+        final List<Thread>  threads     = new ArrayList<>();
+        for (int i = 0; i < numThreads; i++) {
+            threads.add(
+                new Thread(() -> {
+                    for (int j = 0; j < numIterations; j++) {
+                        final Object element = stack.poll();
+                        if (element == null) {
+                            numMissing.incrementAndGet();
+                        }
+                        else if (!stack.offer(element)) {
+                            numRejected.incrementAndGet();
+                        }
+                    }
+                })
+            );
+        }
+        for (Thread thread : threads) {
+            thread.start();
+        }
+        for (Thread thread : threads) {
+            thread.join();
+        }
+
+        assertEquals(0, numMissing .get());
+        assertEquals(0, numRejected.get());
+
+        // And they should all still be there
+        for (int i = 0; i < numThreads; i++) {
+            assertNotNull(stack.poll());
+        }
+        assertNull(stack.poll());
+    }
+}
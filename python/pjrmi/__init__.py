@@ -21,7 +21,7 @@ import weakref
 
 from   builtins         import ascii
 from   inspect          import getfullargspec
-from   threading        import (Condition, Lock, RLock, Thread,
+from   threading        import (Condition, Event, Lock, RLock, Thread,
                                 current_thread)
 from   traceback        import format_tb
 from   types            import (BuiltinMethodType, FunctionType, MethodType)
@@ -50,6 +50,20 @@ _DEEP_DEBUG = 5
 _PJRMI_FATJAR = "{}/lib/pjrmi.jar".format(os.path.dirname(__file__))
 # Required shared libraries from the module dir.
 _PJRMI_SHAREDLIBS_PATH = os.path.dirname(__file__) + '/lib'
+# The flag telling socket reads to wait until the whole buffer is filled, where
+# the platform supports that.
+_MSG_WAITALL = getattr(socket, 'MSG_WAITALL', 0)
+
+# Precompiled wire formats. These are used on every message, and for every
+# primitive value, so we avoid re-parsing the format strings each time.
+_STRUCT_HEADER  = struct.Struct('!cqii')
+_STRUCT_HANDLE  = struct.Struct('!qi')
+_STRUCT_FLOAT   = struct.Struct('!f')
+_STRUCT_DOUBLE  = struct.Struct('!d')
+_STRUCT_INT64   = struct.Struct('!q')
+_STRUCT_INT32   = struct.Struct('!i')
+_STRUCT_INT16   = struct.Struct('!h')
+_STRUCT_INT8    = struct.Struct('!b')
 
 class PJRmi:
     """
@@ -139,6 +153,12 @@ class PJRmi:
     _ARGUMENT_METHOD    = b'M'
     _ARGUMENT_LAMBDA    = b'L'
 
+    # Pre-formatted versions of values which we send a lot, so that we don't
+    # have to build them afresh each time
+    _FORMATTED_TRUE     = b'\x01'
+    _FORMATTED_FALSE    = b'\x00'
+    _NULL_REFERENCE     = _ARGUMENT_REFERENCE + _STRUCT_INT64.pack(_NULL_HANDLE)
+
     # The wire format for passing objects from Java to python in things like
     # method calls
     _VALUE_FORMAT_REFERENCE                = b'A'
@@ -189,15 +209,44 @@ class PJRmi:
     # (inclusive). 2147483647 is 2^31-1, also known as Integer.MAX_VALUE.
     _MAX_JAVA_ARRAY_SIZE = 2147483647
 
+    # Payloads at least this big are sent separately from their header, rather
+    # than being copied into a single message buffer along with it. For small
+    # messages the copy is cheaper than the extra write.
+    _MIN_UNCOPIED_PAYLOAD_SIZE = 64 * 1024
+
+    # How we send 1D numeric numpy arrays when we are free to pick the Java
+    # type, keyed by dtype name. The values are the numpy type to strictly cast
+    # to, the big-endian dtype to send it as, and the name of our attribute
+    # holding the Java array class.
+    _NDARRAY_OBJECT_FORMATS = {
+        'int8'    : (numpy.int8,    '>i1', '_L_java_lang_byte'  ),
+        'int16'   : (numpy.int16,   '>i2', '_L_java_lang_short' ),
+        'int32'   : (numpy.int32,   '>i4', '_L_java_lang_int'   ),
+        'int64'   : (numpy.int64,   '>i8', '_L_java_lang_long'  ),
+        'float32' : (numpy.float32, '>f4', '_L_java_lang_float' ),
+        'float64' : (numpy.float64, '>f8', '_L_java_lang_double'),
+    }
+
     # All the instance, keyed by id()
     _INSTANCES = weakref.WeakValueDictionary()
 
 
-    def __init__(self, transport, use_shm_arg_passing=False):
+    def __init__(self, transport, use_shm_arg_passing=False,
+                 min_shm_arg_passing_size=0):
         """
         PJRmi constructor method.
 
-        :param transport: The underlying data transport to connect over.
+        :param transport:                The underlying data transport to connect
+                                         over.
+        :param use_shm_arg_passing:      Whether to enable passing of some values
+                                         by SHM copying. This requires the C
+                                         extension to function.
+        :param min_shm_arg_passing_size: When SHM argument passing is enabled,
+                                         arrays of fewer than this many bytes are
+                                         still sent inline. For small arrays the
+                                         fixed cost of writing, mapping and
+                                         removing a file can outweigh that of
+                                         copying the data.
         """
 
         # First we register ourselves with the global dictionary
@@ -255,6 +304,7 @@ class PJRmi:
         self._eof                = False
         self._JavaClass          = _JavaClass
         self._use_shmdata        = use_shm_arg_passing
+        self._min_shmdata_size   = min_shm_arg_passing_size
         self._shmdata_files      = list()
         self._shmdata_tidylists  = list()
         self._thread_id_xor      = random.randint(0, 0x7fffffffffffffff)
@@ -1271,12 +1321,23 @@ public class TestInjectSource {
             # Pack everything by hand to avoid the overhead of multiple function
             # calls
             request_id = self._send_request_id()
-            self._transport.send(b"%c%s%s" % (msg_type,
-                                              struct.pack('!qii',
-                                                          thread_id,
-                                                          request_id,
-                                                          payload_size),
-                                              payload))
+            header = _STRUCT_HEADER.pack(msg_type,
+                                         thread_id,
+                                         request_id,
+                                         payload_size)
+            if payload_size < self._MIN_UNCOPIED_PAYLOAD_SIZE:
+                # Small enough that we can just send it all in one go
+                self._transport.send(header + payload)
+            else:
+                # Big payloads, like array data, we avoid duplicating in memory
+                # by sending them directly after the header. If the transport
+                # supports it then we do this in a single vectored write.
+                sendmsg = getattr(self._transport, 'sendmsg', None)
+                if sendmsg is None:
+                    self._transport.send(header)
+                    self._transport.send(payload)
+                else:
+                    sendmsg((header, payload))
 
         return request_id
 
@@ -1297,29 +1358,14 @@ public class TestInjectSource {
         while True:
             # Need to read something off the wire. We want 17 bytes in the
             # header, which we'll unpack below.
-            result = b''
-            while len(result) < 17:
-                # Read in the data on the connection; this will block
-                # until it's read something
-                chunk = self._transport.recv(17 - len(result))
-
-                # If the result is empty that's Python telling us the
-                # we've hit the EOF and the connection is dead
-                if len(chunk) == 0:
-                    self._eof = True
-                    raise EOFError("Connection to Java is closed")
-
-                # Add on the bit we read
-                result += chunk
+            result = self._recv_exactly(17)
 
             # See what we got back. Unpack this all in one go so as to avoid the
             # overhead of calling _read_foo() multiple times.
-            (msg_type, thread_id, request_id, payload_size) = struct.unpack('!cqii', result)
+            (msg_type, thread_id, request_id, payload_size) = _STRUCT_HEADER.unpack(result)
 
             # Read the payload
-            payload = b''
-            while len(payload) < payload_size:
-                payload += self._transport.recv(payload_size - len(payload))
+            payload = self._recv_exactly(payload_size)
             assert(len(payload) == payload_size)
 
             # See if it happened to be a callback
@@ -1333,6 +1379,65 @@ public class TestInjectSource {
                 return (msg_type, request_id, payload)
 
 
+    def _recv_exactly(self, count):
+        """
+        Read exactly ``count`` bytes off the wire, blocking until they have all
+        arrived.
+
+        This gives back a bytes-like object; a `bytes` if it all arrived in one
+        go, else the `bytearray` which it was read into. We don't copy the
+        latter into a `bytes` since it's the large payloads which take multiple
+        reads and all the consumers of the data are happy with either.
+        """
+
+        # Nothing to read for empty payloads
+        if count == 0:
+            return b''
+
+        # Read in the data on the connection; this will block until it's read
+        # something. Most messages are small and arrive all in one go so we
+        # can just hand that back.
+        chunk = self._transport.recv(count)
+        if len(chunk) == count:
+            return chunk
+
+        # Otherwise we read the remainder directly into a buffer of the right
+        # size. Growing a bytes object by concatenating each chunk on the end
+        # is quadratic in the size of the payload, which really hurts for
+        # large arrays.
+        buffer    = bytearray(count)
+        view      = memoryview(buffer)
+        recv_into = getattr(self._transport, 'recv_into', None)
+        got       = 0
+        read      = len(chunk)
+        view[:read] = chunk
+        while True:
+            # If the result is empty that's Python telling us the we've hit
+            # the EOF and the connection is dead
+            if read == 0:
+                self._eof = True
+                raise EOFError("Connection to Java is closed")
+
+            # Add on the bit we read and see if we're done
+            got += read
+            if got >= count:
+                break
+
+            # Read the next bit, directly into the buffer if the transport
+            # supports that
+            if recv_into is None:
+                chunk = self._transport.recv(count - got)
+                read  = len(chunk)
+                view[got:got + read] = chunk
+            else:
+                read = recv_into(view[got:])
+
+        # Give back the buffer itself; turning it into a bytes object would
+        # mean copying all of it again
+        view.release()
+        return buffer
+
+
     def _read_result(self, want_request_id):
         """
         Read the result of a send() call.
@@ -1638,7 +1743,7 @@ public class TestInjectSource {
         else:
             # For Objects we simply read the handle (and any raw value) and
             # create them
-            (handle, raw_len) = struct.unpack('!qi', payload[idx:idx+12])
+            (handle, raw_len) = _STRUCT_HANDLE.unpack_from(payload, idx)
             idx += 12
             if raw_len >= 0:
                 raw  = payload[idx : idx + raw_len]
@@ -1685,13 +1790,14 @@ public class TestInjectSource {
 
 
     def _handle_pickle_bytes(self, msg_type, payload):
-        # Read in the array of bytes (as a string)
-        (value, idx) = self._read_byte_array(payload, 0)
+        # Read in the array of bytes. We do this via a memoryview so that
+        # slicing out the data does not copy it; pickled arrays can be large.
+        (value, idx) = self._read_byte_array(memoryview(payload), 0)
 
         # Get the value encding format, and the data. For the format we use a
         # slice of length 1, instead of indexing with [0], because direct
         # indexing of bytes returns an int not a bytes object.
-        value_format = value[0:1]
+        value_format = bytes(value[0:1])
         data         = value[1: ]
 
         # See if we need to decompress it
@@ -2401,7 +2507,7 @@ public class TestInjectSource {
         Format a float as 4 raw bytes.
         """
 
-        return struct.pack('!f', value)
+        return _STRUCT_FLOAT.pack(value)
 
 
     def _format_double(self, value):
@@ -2409,7 +2515,7 @@ public class TestInjectSource {
         Format a double as 8 raw bytes.
         """
 
-        return struct.pack('!d', value)
+        return _STRUCT_DOUBLE.pack(value)
 
 
     def _format_int64(self, value):
@@ -2417,7 +2523,7 @@ public class TestInjectSource {
         Format a 64-bit int as raw bytes.
         """
 
-        return struct.pack('!q', value)
+        return _STRUCT_INT64.pack(value)
 
 
     def _format_int32(self, value):
@@ -2425,7 +2531,7 @@ public class TestInjectSource {
         Format a 32-bit int as raw bytes.
         """
 
-        return struct.pack('!i', value)
+        return _STRUCT_INT32.pack(value)
 
 
     def _format_int16(self, value):
@@ -2433,7 +2539,7 @@ public class TestInjectSource {
         Format a 16-bit int as raw bytes.
         """
 
-        return struct.pack('!h', value)
+        return _STRUCT_INT16.pack(value)
 
 
     def _format_int8(self, value):
@@ -2449,13 +2555,16 @@ public class TestInjectSource {
         Format a boolean as a byte.
         """
 
-        return (b"%c" % (1 if value else 0))
+        return self._FORMATTED_TRUE if value else self._FORMATTED_FALSE
 
 
     def _format_array(self, value, dtype):
         """
         Serializes the data of a one-dimensional array, or an iterable, according to
         the given dtype.
+
+        This gives back a buffer, not ``bytes``, since the callers always
+        append it to a header and that concatenation is copy enough.
         """
 
         dtype = numpy.dtype(dtype)
@@ -2468,13 +2577,12 @@ public class TestInjectSource {
         if arr.ndim != 1:
             raise TypeError('The provided array must be one dimensional')
 
-        if len(arr) > self._MAX_JAVA_ARRAY_SIZE:
-            raise TypeError('The given array is larger than Java can represent')
+        # We don't check the length here; every caller has already done so via
+        # _validate_format_array(), and has written it out, before we're called
 
-        return bytes(numpy.array(strict_array(dtype.type, arr),
-                                 dtype=dtype,
-                                 copy=False,
-                                 order='C').data)
+        return memoryview(strict_array(dtype.type, arr).astype(dtype,
+                                                               order='C',
+                                                               copy=False))
 
 
     def _format_method_as(self, value, klass):
@@ -2638,6 +2746,16 @@ public class TestInjectSource {
         return True
 
 
+    def _should_format_shmdata(self, value, klass):
+        """
+        Returns whether we should marshall the given value using SHM methods.
+        This is the case when we can do so and the value is at least as big as
+        the ``min_shm_arg_passing_size`` which we were given.
+        """
+        return (self._can_format_shmdata(value, klass) and
+                value.nbytes >= self._min_shmdata_size)
+
+
     def _validate_format_array(self, obj):
         """
         Raises a `ValueError` exception if the given object is an array-like but
@@ -2819,8 +2937,7 @@ public class TestInjectSource {
                 # take objects since these use explicit casting, i.e.
                 # "foo(Integer i)" cannot be given a Short.
                 if value is None:
-                    return (self._ARGUMENT_REFERENCE +
-                            self._format_int64(self._NULL_HANDLE))
+                    return self._NULL_REFERENCE
 
                 elif isinstance(value, _JavaObject):
                     return (self._ARGUMENT_REFERENCE +
@@ -2861,52 +2978,34 @@ public class TestInjectSource {
                             self._format_int32(self._java_lang_Double._type_id) +
                             self._format_double(strict_number(numpy.float64, value)))
 
-                elif allow_format_shmdata and self._can_format_shmdata(value, klass):
+                elif allow_format_shmdata and self._should_format_shmdata(value, klass):
                     # This is an one-dimensional numpy array that we know we can handle natively
                     return self._format_shmdata(klass, value, strict_types)
 
-                elif isinstance(value, numpy.ndarray) and len(value.shape) == 1 and value.dtype.name == 'int8':
+                # For the 1D numeric numpy arrays we look up how to send them,
+                # rather than testing for each dtype in turn. We don't need to
+                # make the value contiguous first; the astype() call both
+                # gathers the elements and swaps them into network byte order,
+                # in a single pass, giving back a new contiguous array.
+                elif (isinstance(value, numpy.ndarray) and
+                      len(value.shape) == 1 and
+                      value.dtype.name in self._NDARRAY_OBJECT_FORMATS):
+                    (typ, wire_dtype, array_class) = \
+                        self._NDARRAY_OBJECT_FORMATS[value.dtype.name]
+                    # Appending the buffer directly, rather than turning it
+                    # into bytes first, saves another full copy of the data.
                     return (self._ARGUMENT_VALUE +
-                            self._format_int32(self._L_java_lang_byte._type_id) +
+                            self._format_int32(getattr(self, array_class)._type_id) +
                             self._format_int32(len(value)) +
-                            memoryview(strict_array(numpy.int8, numpy.ascontiguousarray(value)).astype(">i1")).tobytes())
-
-                elif isinstance(value, numpy.ndarray) and len(value.shape) == 1 and value.dtype.name == 'int16':
-                    return (self._ARGUMENT_VALUE +
-                            self._format_int32(self._L_java_lang_short._type_id) +
-                            self._format_int32(len(value)) +
-                            memoryview(strict_array(numpy.int16, numpy.ascontiguousarray(value)).astype(">i2")).tobytes())
-
-                elif isinstance(value, numpy.ndarray) and len(value.shape) == 1 and value.dtype.name == 'int32':
-                    return (self._ARGUMENT_VALUE +
-                            self._format_int32(self._L_java_lang_int._type_id) +
-                            self._format_int32(len(value)) +
-                            memoryview(strict_array(numpy.int32, numpy.ascontiguousarray(value)).astype(">i4")).tobytes())
-
-                elif isinstance(value, numpy.ndarray) and len(value.shape) == 1 and value.dtype.name == 'int64':
-                    return (self._ARGUMENT_VALUE +
-                            self._format_int32(self._L_java_lang_long._type_id) +
-                            self._format_int32(len(value)) +
-                            memoryview(strict_array(numpy.int64, numpy.ascontiguousarray(value)).astype(">i8")).tobytes())
-
-                elif isinstance(value, numpy.ndarray) and len(value.shape) == 1 and value.dtype.name == 'float32':
-                    return (self._ARGUMENT_VALUE +
-                            self._format_int32(self._L_java_lang_float._type_id) +
-                            self._format_int32(len(value)) +
-                            memoryview(strict_array(numpy.float32, numpy.ascontiguousarray(value)).astype(">f4")).tobytes())
-
-                elif isinstance(value, numpy.ndarray) and len(value.shape) == 1 and value.dtype.name == 'float64':
-                    return (self._ARGUMENT_VALUE +
-                            self._format_int32(self._L_java_lang_double._type_id) +
-                            self._format_int32(len(value)) +
-                            memoryview(strict_array(numpy.float64, numpy.ascontiguousarray(value)).astype(">f8")).tobytes())
+                            memoryview(strict_array(typ, value).astype(wire_dtype)))
 
                 elif isinstance(value, numpy.ndarray) and len(value.shape) == 1 and value.dtype.name == 'bool':
+                    # numpy stores booleans as single 0 or 1 bytes, which is
+                    # just what we send, so we can take them in bulk
                     return (self._ARGUMENT_VALUE +
                             self._format_int32(self._L_java_lang_boolean._type_id) +
                             self._format_int32(len(value)) +
-                            b''.join(self._format_boolean(True if el else False)
-                                         for el in value))
+                            value.view(numpy.uint8).tobytes())
 
                 elif isinstance(value, numpy.ndarray) and len(value.shape) == 1 and value.dtype.name.startswith('str'):
                     return (self._ARGUMENT_VALUE +
@@ -3027,7 +3126,7 @@ public class TestInjectSource {
 
             elif value is None and not klass._is_primitive:
                 # Allow null to match anything, though this could lead to ambiguity...
-                return self._ARGUMENT_REFERENCE + self._format_int64(self._NULL_HANDLE)
+                return self._NULL_REFERENCE
 
             # Marshalling to a Number type?
             elif klass._type_id == self._java_lang_Number._type_id:
@@ -3182,8 +3281,17 @@ public class TestInjectSource {
 
             elif klass._type_id == self._L_java_lang_boolean._type_id:
                 self._validate_format_array(value)
-                if allow_format_shmdata and self._can_format_shmdata(value, klass):
+                if allow_format_shmdata and self._should_format_shmdata(value, klass):
                     return self._format_shmdata(klass, value, strict_types)
+                elif (isinstance(value, numpy.ndarray) and
+                      len(value.shape) == 1            and
+                      value.dtype.name == 'bool'):
+                    # Take numpy's 0 or 1 bytes in bulk, like in the Object
+                    # case above
+                    return (self._ARGUMENT_VALUE +
+                            self._format_int32(klass._type_id) +
+                            self._format_int32(len(value)) +
+                            value.view(numpy.uint8).tobytes())
                 else:
                     return (self._ARGUMENT_VALUE +
                             self._format_int32(klass._type_id) +
@@ -3193,7 +3301,7 @@ public class TestInjectSource {
 
             elif klass._type_id == self._L_java_lang_float._type_id:
                 self._validate_format_array(value)
-                if allow_format_shmdata and self._can_format_shmdata(value, klass):
+                if allow_format_shmdata and self._should_format_shmdata(value, klass):
                     return self._format_shmdata(klass, value, strict_types)
                 else:
                     # Use strict against a Python float here to allow truncation
@@ -3207,7 +3315,7 @@ public class TestInjectSource {
                                     numpy.float64,
                                     numpy.ascontiguousarray(value)
                                 ).astype(">f4")
-                            ).tobytes())
+                            ))
 
             elif klass._type_id == self._L_java_lang_byte._type_id:
                 self._validate_format_array(value)
@@ -3218,12 +3326,11 @@ public class TestInjectSource {
                     return (self._ARGUMENT_VALUE +
                             self._format_int32(klass._type_id) +
                             self._format_int32(len(value)) +
-                            b''.join(self._format_int8(el)
-                                     for el in value.encode('ASCII')))
+                            value.encode('ASCII'))
                 else:
                     # Anything else we attempt to convert into a list of 8bit
                     # integers (bytes)
-                    if allow_format_shmdata and self._can_format_shmdata(value, klass):
+                    if allow_format_shmdata and self._should_format_shmdata(value, klass):
                         return self._format_shmdata(klass, value, strict_types)
                     else:
                         return (self._ARGUMENT_VALUE +
@@ -3233,7 +3340,7 @@ public class TestInjectSource {
 
             elif klass._type_id == self._L_java_lang_short._type_id:
                 self._validate_format_array(value)
-                if allow_format_shmdata and self._can_format_shmdata(value, klass):
+                if allow_format_shmdata and self._should_format_shmdata(value, klass):
                     return self._format_shmdata(klass, value, strict_types)
                 else:
                     return (self._ARGUMENT_VALUE +
@@ -3243,7 +3350,7 @@ public class TestInjectSource {
 
             elif klass._type_id == self._L_java_lang_int._type_id:
                 self._validate_format_array(value)
-                if allow_format_shmdata and self._can_format_shmdata(value, klass):
+                if allow_format_shmdata and self._should_format_shmdata(value, klass):
                     return self._format_shmdata(klass, value, strict_types)
                 else:
                     return (self._ARGUMENT_VALUE +
@@ -3253,7 +3360,7 @@ public class TestInjectSource {
 
             elif klass._type_id == self._L_java_lang_long._type_id:
                 self._validate_format_array(value)
-                if allow_format_shmdata and self._can_format_shmdata(value, klass):
+                if allow_format_shmdata and self._should_format_shmdata(value, klass):
                     return self._format_shmdata(klass, value, strict_types)
                 else:
                     return (self._ARGUMENT_VALUE +
@@ -3263,7 +3370,7 @@ public class TestInjectSource {
 
             elif klass._type_id == self._L_java_lang_double._type_id:
                 self._validate_format_array(value)
-                if allow_format_shmdata and self._can_format_shmdata(value, klass):
+                if allow_format_shmdata and self._should_format_shmdata(value, klass):
                     return self._format_shmdata(klass, value, strict_types)
                 else:
                     return (self._ARGUMENT_VALUE +
@@ -3450,7 +3557,7 @@ public class TestInjectSource {
         :return: The value, the new offset into the byte buffer.
         """
 
-        return (struct.unpack('!f', bytes[index:index+4])[0], index+4)
+        return (_STRUCT_FLOAT.unpack_from(bytes, index)[0], index+4)
 
 
     def _read_double(self, bytes, index):
@@ -3460,7 +3567,7 @@ public class TestInjectSource {
         :return: The value, the new offset into the byte buffer.
         """
 
-        return (struct.unpack('!d', bytes[index:index+8])[0], index+8)
+        return (_STRUCT_DOUBLE.unpack_from(bytes, index)[0], index+8)
 
 
     def _read_int64(self, bytes, index):
@@ -3470,7 +3577,7 @@ public class TestInjectSource {
         :return: The value, the new offset into the byte buffer.
         """
 
-        return (struct.unpack('!q', bytes[index:index+8])[0], index+8)
+        return (_STRUCT_INT64.unpack_from(bytes, index)[0], index+8)
 
 
     def _read_int32(self, bytes, index):
@@ -3480,7 +3587,7 @@ public class TestInjectSource {
         :return: The value, the new offset into the byte buffer
         """
 
-        return (struct.unpack('!i', bytes[index:index+4])[0], index+4)
+        return (_STRUCT_INT32.unpack_from(bytes, index)[0], index+4)
 
 
     def _read_int16(self, bytes, index):
@@ -3490,7 +3597,7 @@ public class TestInjectSource {
         :return: The value, the new offset into the byte buffer.
         """
 
-        return (struct.unpack('!h', bytes[index:index+2])[0], index+2)
+        return (_STRUCT_INT16.unpack_from(bytes, index)[0], index+2)
 
 
     def _read_int8(self, bytes, index):
@@ -3500,7 +3607,7 @@ public class TestInjectSource {
         :return: The value, the new offset into the byte buffer.
         """
 
-        return (struct.unpack('!b', bytes[index:index+1])[0], index+1)
+        return (_STRUCT_INT8.unpack_from(bytes, index)[0], index+1)
 
 
     def _read_byte(self, bytes, index):
@@ -3966,15 +4073,17 @@ public class TestInjectSource {
         # and this difference might confuse users. However, we hope that these
         # cases will be rare and that someone, with a bit of PJRmi nous, will be
         # around to explain what's happening.
-        strict_types_for_num_args = set()
-        if len(methods) > 1:
-            by_argnum = set()
-            for method in methods:
-                num_args = len(method['argument_type_ids'])
-                if num_args in by_argnum:
-                    strict_types_for_num_args.add(num_args)
-                else:
-                    by_argnum.add(num_args)
+        #
+        # We also group the methods by how many arguments they take, so that
+        # each call only attempts to bind to the ones which it could match.
+        methods_by_num_args = dict()
+        for method in methods:
+            methods_by_num_args.setdefault(len(method['argument_type_ids']),
+                                           []).append(method)
+        strict_types_for_num_args = set(
+            num_args for (num_args, overloads) in methods_by_num_args.items()
+            if len(overloads) > 1
+        )
 
         # Define the method. This will handle all calls of a given method name
         # (handling Java overloading).
@@ -3983,20 +4092,25 @@ public class TestInjectSource {
             # the duration of this method, since we call it a lot below
             log_debug = LOG.isEnabledFor(logging.DEBUG)
 
-            # Read the keyword arguments
-            return_format = kwargs.pop('__pjrmi_return_format__',
-                                       self._VALUE_FORMAT_REFERENCE)
-            sync_mode     = kwargs.pop('__pjrmi_sync_mode__',
-                                       self.SYNC_MODE_SYNCHRONOUS)
+            # Read the keyword arguments. Most calls don't give any, in which
+            # case we have the defaults, which need no checking.
+            if not kwargs:
+                return_format = self._VALUE_FORMAT_REFERENCE
+                sync_mode     = self.SYNC_MODE_SYNCHRONOUS
+            else:
+                return_format = kwargs.pop('__pjrmi_return_format__',
+                                           self._VALUE_FORMAT_REFERENCE)
+                sync_mode     = kwargs.pop('__pjrmi_sync_mode__',
+                                           self.SYNC_MODE_SYNCHRONOUS)
 
-            if len(kwargs) != 0:
-                raise ValueError('Unrecognized keyword arguments: %r' % kwargs)
+                if len(kwargs) != 0:
+                    raise ValueError('Unrecognized keyword arguments: %r' % kwargs)
 
-            # Validate args
-            if return_format not in self._ACCEPTED_VALUE_FORMATS:
-                raise ValueError('Unhandled return format: ' + return_format)
-            if sync_mode     not in self._ACCEPTED_SYNC_MODES:
-                raise ValueError('Unhandled sync mode: ' + sync_mode)
+                # Validate args
+                if return_format not in self._ACCEPTED_VALUE_FORMATS:
+                    raise ValueError('Unhandled return format: ' + return_format)
+                if sync_mode     not in self._ACCEPTED_SYNC_MODES:
+                    raise ValueError('Unhandled sync mode: ' + sync_mode)
 
             if log_debug:
                 LOG.debug("Attempting to bind for %s", method_name)
@@ -4012,7 +4126,7 @@ public class TestInjectSource {
             exceptions   = list()
             matches      = list() # list(tuple(method, args))
             strict_types = num_args in strict_types_for_num_args
-            for method in methods:
+            for method in methods_by_num_args.get(num_args, ()):
                 # See if we had the right number of arguments
                 argument_type_ids = method['argument_type_ids']
                 want_args = len(argument_type_ids)
@@ -4284,15 +4398,14 @@ public class TestInjectSource {
         # mimics the code in _create_method() and we won't repeat all the
         # comments here. Suffice to say, if we have overloading then we want
         # strict_types.
-        strict_types_for_num_args = set()
-        if len(ctors) > 1:
-            by_argnum = set()
-            for ctor in ctors:
-                num_args = len(ctor['argument_type_ids'])
-                if num_args in by_argnum:
-                    strict_types_for_num_args.add(num_args)
-                else:
-                    by_argnum.add(num_args)
+        ctors_by_num_args = dict()
+        for ctor in ctors:
+            ctors_by_num_args.setdefault(len(ctor['argument_type_ids']),
+                                         []).append(ctor)
+        strict_types_for_num_args = set(
+            num_args for (num_args, overloads) in ctors_by_num_args.items()
+            if len(overloads) > 1
+        )
 
         # Define the method
         def __new__(*args, **kwargs):
@@ -4304,7 +4417,7 @@ public class TestInjectSource {
             exceptions   = list()
             matches      = list() # list(tuple(ctor, args))
             strict_types = num_args in strict_types_for_num_args
-            for ctor in ctors:
+            for ctor in ctors_by_num_args.get(num_args, ()):
                 # See if we had the right number of arguments
                 argument_type_ids = ctor['argument_type_ids']
                 want_args = len(argument_type_ids)
@@ -4338,9 +4451,14 @@ public class TestInjectSource {
                                     exception = (e, tb)
 
                     except (TypeError, ValueError) as e:
-                        exceptions.append(str(e))
-                        LOG.debug("Failed to bind variable for %s constructor: %s",
-                                  klass._classname, e)
+                        # Keep the exception itself, rather than its message,
+                        # since rendering that can be costly (e.g. for a
+                        # _LazyTypeError it may mean a call to Java) and we only
+                        # need it if we end up failing to find any match
+                        exceptions.append(e)
+                        if LOG.isEnabledFor(logging.DEBUG):
+                            LOG.debug("Failed to bind variable for %s constructor: %s",
+                                      klass._classname, e)
                         continue
 
                     # Did we match anything already?
@@ -4449,7 +4567,7 @@ public class TestInjectSource {
                     "Could not find a constructor matching %s(%s): %s" %
                     (klass._classname,
                      ', '.join(str(i.__class__) for i in args),
-                     '; '.join(exceptions))
+                     '; '.join(map(str, exceptions)))
                 )
 
         # Give it back
@@ -5335,7 +5453,7 @@ def connect_to_child_jvm(main_class='com.deshaw.pjrmi.UnixFifoProvider',
                          classpath=(), java_args=(), application_args=(), timeout=60,
                          stdin='/dev/stdin', stdout='/dev/stdout', stderr='/dev/stderr',
                          interactive_mode=True, use_shm_arg_passing=False,
-                         impl=PJRmi):
+                         min_shm_arg_passing_size=0, impl=PJRmi):
     """
     Create a child JVM instance and connect to it.
 
@@ -5371,6 +5489,9 @@ def connect_to_child_jvm(main_class='com.deshaw.pjrmi.UnixFifoProvider',
                                 make it more friendly to that.
     :param use_shm_arg_passing: Whether to enable passing of some values by SHM
                                 copying. This requires the C extension to function.
+    :param min_shm_arg_passing_size:
+                                The size, in bytes, below which arrays are sent
+                                inline even when SHM passing is enabled.
     :param impl:                The `PJRmi` implementation to use.
     """
 
@@ -5385,7 +5506,8 @@ def connect_to_child_jvm(main_class='com.deshaw.pjrmi.UnixFifoProvider',
                                stdin=stdin,
                                stdout=stdout,
                                stderr=stderr),
-             use_shm_arg_passing=use_shm_arg_passing)
+             use_shm_arg_passing=use_shm_arg_passing,
+             min_shm_arg_passing_size=min_shm_arg_passing_size)
     c.connect()
 
     # Turn off a couple of things which annoy people in interactive mode
@@ -5403,6 +5525,7 @@ def connect_to_child_jvm(main_class='com.deshaw.pjrmi.UnixFifoProvider',
 
 def become_pjrmi_minion(stdin=None, stdout=None, stderr=None,
                         use_shm_arg_passing=False,
+                        min_shm_arg_passing_size=0,
                         impl=PJRmi):
     """
     Turn this process into a passive child of a Java process, which will drive
@@ -5415,7 +5538,9 @@ def become_pjrmi_minion(stdin=None, stdout=None, stderr=None,
 
     global _pjrmi_connection
     t = StdioTransport(stdin=stdin, stdout=stdout, stderr=stderr)
-    _pjrmi_connection = impl(t, use_shm_arg_passing=use_shm_arg_passing)
+    _pjrmi_connection = impl(t,
+                             use_shm_arg_passing=use_shm_arg_passing,
+                             min_shm_arg_passing_size=min_shm_arg_passing_size)
     _pjrmi_connection.connect()
 
     # Ensure that this process is connected to a worker-enabled JVM instance,
@@ -5423,9 +5548,9 @@ def become_pjrmi_minion(stdin=None, stdout=None, stderr=None,
     if not _pjrmi_connection._has_receiver:
         raise ValueError("Not connected to a worker-capable JVM")
 
-    # Now sleep until we notice the transport go away
-    while t.connected():
-        time.sleep(1)
+    # Now wait until we notice the transport go away. We are woken as soon as
+    # that happens, rather than polling for it, so that we exit promptly.
+    t.wait_for_close()
 
 def get_config():
     """
@@ -5692,6 +5817,10 @@ class JavaMethod:
 #   send(bytes)   -- Sends the bag or raw bytes completely.
 #   recv(count)   -- Receives at most 'count' bytes from the other side. Blocks
 #                    until data is available; returns [] upon EOF.
+#   sendmsg(bufs) -- Sends the given sequence of bags of bytes completely, in
+#                    order, without first joining them together (optional).
+#   recv_into(buf)-- Receives at most len(buf) bytes into the given writable
+#                    buffer, returning the number read; 0 upon EOF (optional).
 #   __str__()     -- A brief description of the transport (optional).
 
 class SocketTransport:
@@ -5711,6 +5840,11 @@ class SocketTransport:
         self._port   = port
         self._socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
 
+        # We send whole messages in one or two writes so we don't want Nagle's
+        # algorithm holding back the tail end of them while it waits for an ACK
+        # from the other side
+        self._socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
 
     def __str__(self):
         """
@@ -5751,6 +5885,32 @@ class SocketTransport:
         self._socket.sendall(bytes)
 
 
+    def sendmsg(self, buffers):
+        """
+        Send a sequence of bags of bytes over the connection, in order. Where
+        possible this is done using vectored writes so that the buffers do not
+        need to be joined together first.
+        """
+
+        views = self._byte_views(buffers)
+
+        # Not all platforms have sendmsg()
+        if not hasattr(self._socket, 'sendmsg'):
+            for view in views:
+                self._socket.sendall(view)
+            return
+
+        # Unlike sendall(), sendmsg() may only write some of the data so we keep
+        # going until it has all been sent, dropping the buffers which have been
+        # written and trimming the one which was partially written
+        while views:
+            sent = self._socket.sendmsg(views)
+            while views and sent >= len(views[0]):
+                sent -= len(views.pop(0))
+            if sent > 0:
+                views[0] = views[0][sent:]
+
+
     def recv(self, count):
         """
         Receive at most 'count' bytes from the connection. This will block until
@@ -5760,6 +5920,40 @@ class SocketTransport:
         return self._socket.recv(count)
 
 
+    @staticmethod
+    def _byte_views(buffers):
+        """
+        Turn the given buffers into flat byte views, for sending.
+
+        The buffers are usually bytes but they may be anything which supports
+        the buffer protocol. Neither ``cast()`` nor the socket calls can handle
+        non-contiguous ones (e.g. strided numpy views), so those are copied into
+        contiguous bytes first.
+        """
+
+        views = []
+        for buffer in buffers:
+            view = memoryview(buffer)
+            if not view.c_contiguous:
+                view = memoryview(view.tobytes())
+            views.append(view.cast('B'))
+        return views
+
+
+    def recv_into(self, buffer):
+        """
+        Receive at most ``len(buffer)`` bytes from the connection directly into
+        the given buffer. This will block until data is available and return
+        the number of bytes read, which will be zero on EOF.
+        """
+
+        # Ask the kernel to wait until it has filled the buffer, since that's
+        # what the caller wants. This saves us going around the read loop for
+        # every packet of a large message. We may still get back less than we
+        # asked for, for example if a signal interrupts the call.
+        return self._socket.recv_into(buffer, 0, _MSG_WAITALL)
+
+
     def is_localhost(self):
         """
         Returns whether we are guaranteed to be on the same host. Might return
@@ -5849,6 +6043,26 @@ class SSLSocketTransport(SocketTransport):
             os.rmdir(tmpdir)
 
 
+    def sendmsg(self, buffers):
+        """
+        Send a sequence of bags of bytes over the connection, in order. SSL
+        sockets don't support vectored writes so these are sent one by one.
+        """
+
+        for view in self._byte_views(buffers):
+            self._socket.sendall(view)
+
+
+    def recv_into(self, buffer):
+        """
+        Receive at most ``len(buffer)`` bytes from the connection directly into
+        the given buffer. SSL sockets don't accept any flags so this is just a
+        plain read.
+        """
+
+        return self._socket.recv_into(buffer)
+
+
 class InprocessTransport:
     """
     An underlying transport for talking to a JVM running in the same process.
@@ -6240,6 +6454,15 @@ class UnixFifoTransport:
         return self._from_fifo.read(count)
 
 
+    def recv_into(self, buffer):
+        """
+        Read at most ``len(buffer)`` bytes from the FIFO directly into the given
+        buffer. This will block until data is available and return the number
+        of bytes read, which will be zero on EOF.
+        """
+        return self._from_fifo.readinto(buffer)
+
+
     def is_localhost(self):
         """
         Returns whether we are guaranteed to be on the same host. Might return
@@ -6266,6 +6489,10 @@ class StdioTransport:
         # Whether we have "connected"
         self._connected = False
 
+        # Set once stdin has closed, so that anyone waiting for that to happen
+        # may be woken straight away
+        self._closed = Event()
+
         # Capture the stdio file handles for ourselves. The Java parent will use
         # stdin and stdout for the transport and redirect stderr to its own
         # logs. Retrieve the underlying binary buffers. We need to be able to
@@ -6350,9 +6577,33 @@ class StdioTransport:
         result = self._from.read(count)
         if result == b'':
             self._connected = False
+            self._closed.set()
         return result
 
 
+    def recv_into(self, buffer):
+        """
+        Read at most ``len(buffer)`` bytes from the FIFO directly into the given
+        buffer. This will block until data is available and return the number
+        of bytes read, which will be zero on EOF.
+        """
+
+        # Watch for stdin closing which means our parent process has gone away
+        result = self._from.readinto(buffer)
+        if result == 0:
+            self._connected = False
+            self._closed.set()
+        return result
+
+
+    def wait_for_close(self):
+        """
+        Block until stdin is closed on us, i.e. until our parent process has
+        gone away.
+        """
+        self._closed.wait()
+
+
     def _tell_java(self, message):
         """
         Send an ASCII message to the Java side via our stderr stream.
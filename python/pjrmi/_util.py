@@ -5,6 +5,11 @@ Various helper functions which support PJRmi.
 import numbers
 import numpy
 
+# The floating point types which strict_number() and strict_array() handle. We
+# look types up in here, rather than in a tuple, since it is done for every
+# value which they are given.
+_FLOAT_TYPES = frozenset((numpy.float32, numpy.float64))
+
 class ImpreciseRepresentationError(ValueError):
     """
     A value could not be represented precisely in the target type.
@@ -127,9 +132,11 @@ def strict_number(typ, value):
 
     # Do the cast, this may throw
     casted = typ(value)
+    is_float = typ in _FLOAT_TYPES
 
-    # NaNs are easy to check
-    if numpy.isnan(casted) and numpy.isnan(value):
+    # NaNs are easy to check. Only the floating point types can hold them so
+    # we avoid the (relatively expensive) ufunc calls for everything else.
+    if is_float and numpy.isnan(casted) and numpy.isnan(value):
         return casted
 
     # Make sure they look the same, in a somewhat simplistic way
@@ -142,8 +149,7 @@ def strict_number(typ, value):
         #   True
         # To catch this we cast the result back to the original type and
         # check that it still matches.
-        if (typ not in (numpy.float32, numpy.float64) or
-            type(value)(casted) == value):
+        if not is_float or type(value)(casted) == value:
             # Either it wasn't being cast to a float, or it matched when we
             # cast it back. Either way, it's safe to hand back.
             return casted
@@ -167,9 +173,11 @@ def strict_array(typ, array):
     if isinstance(array, numpy.ndarray):
         # We can be a little smarter if we have been given a numpy array
 
-        # NOP?
+        # NOP? We compare for equality, rather than identity, since equal
+        # dtypes need not be the same object; for example, those of arrays
+        # which were unpickled or made from a buffer often aren't.
         dtype = numpy.dtype(typ)
-        if array.dtype is dtype:
+        if array.dtype == dtype:
             return array
 
         # If any of the dimensions of the array are zero then this is a
@@ -187,9 +195,29 @@ def strict_array(typ, array):
         # Do the cast, this may throw
         casted = numpy.array(array, dtype=dtype)
 
-        # Strip out the NaNs
-        array_non_nans  = array [numpy.logical_not(numpy.isnan(array ))]
-        casted_non_nans = casted[numpy.logical_not(numpy.isnan(casted))]
+        # If numpy says that the cast can't lose anything then there's no need
+        # to check the result, and so no need for the masks and comparisons
+        # below. The exception is integers going to floats, which numpy deems
+        # "safe" even though large values can lose precision.
+        if (numpy.can_cast(array.dtype, dtype, casting='safe') and
+            not (array.dtype.kind in 'iu' and dtype.kind in 'fc')):
+            return casted
+
+        # Strip out the NaNs. Boolean and integer arrays can't contain any so
+        # we avoid the extra passes, and copies, of masking those; we just
+        # flatten them so that they compare like the masked ones do. The NaN
+        # masks are inverted in place, rather than allocating a second array
+        # for the inverse.
+        if array.dtype.kind in 'biu':
+            array_non_nans  = array.ravel()
+        else:
+            mask            = numpy.isnan(array)
+            array_non_nans  = array [numpy.logical_not(mask, out=mask)]
+        if casted.dtype.kind in 'biu':
+            casted_non_nans = casted.ravel()
+        else:
+            mask            = numpy.isnan(casted)
+            casted_non_nans = casted[numpy.logical_not(mask, out=mask)]
 
         # If we now have nothing then it was all NaNs and we can just give
         # it back directly
@@ -206,7 +234,7 @@ def strict_array(typ, array):
             #   True
             # To catch this we cast the result back to the original type and
             # check that it still matches.
-            if (typ not in (numpy.float32, numpy.float64) or
+            if (typ not in _FLOAT_TYPES or
                 numpy.all(
                     numpy.array(casted_non_nans, dtype=array.dtype) == array_non_nans)
                 ):
@@ -9,6 +9,7 @@ import numpy
 import os
 import pjrmi
 import signal
+import socket
 import subprocess
 import sys
 import tempfile
@@ -229,6 +230,88 @@ class TestPJRmi(TestCase):
         self.assertTrue(numpy.array_equal(v1, numpy.array(bytearray(v2), dtype='byte')))
 
 
+    def test_recv_exactly(self):
+        """
+        Make sure that payloads which take more than one read to arrive are put
+        back together correctly, whether or not the transport supports
+        ``recv_into()``, and that we notice the connection closing part way
+        through.
+        """
+        class ChunkedTransport:
+            """
+            Hands back the data a chunk at a time, like a busy socket might.
+            """
+            def __init__(self_, data, chunk_size):
+                self_._data       = data
+                self_._offset     = 0
+                self_._chunk_size = chunk_size
+
+            def recv(self_, count):
+                count = min(count, self_._chunk_size)
+                result = self_._data[self_._offset:self_._offset + count]
+                self_._offset += len(result)
+                return result
+
+        class ChunkedIntoTransport(ChunkedTransport):
+            def recv_into(self_, buffer):
+                chunk = self_.recv(len(buffer))
+                buffer[:len(chunk)] = chunk
+                return len(chunk)
+
+        class Receiver:
+            """
+            Just what `_recv_exactly()` needs from a `PJRmi` instance.
+            """
+            def __init__(self_, transport):
+                self_._transport = transport
+                self_._eof       = False
+
+        data = bytes(range(256)) * 40
+        for transport_class in (ChunkedTransport, ChunkedIntoTransport):
+            # All in one read
+            receiver = Receiver(transport_class(data, len(data)))
+            self.assertEqual(pjrmi.PJRmi._recv_exactly(receiver, len(data)), data)
+
+            # Over many reads
+            receiver = Receiver(transport_class(data, 1000))
+            self.assertEqual(pjrmi.PJRmi._recv_exactly(receiver, len(data)), data)
+            self.assertFalse(receiver._eof)
+
+            # Then the connection closes before it's all arrived
+            receiver = Receiver(transport_class(data[:-1], 1000))
+            with self.assertRaises(EOFError):
+                pjrmi.PJRmi._recv_exactly(receiver, len(data))
+            self.assertTrue(receiver._eof)
+
+
+    def test_socket_sendmsg(self):
+        """
+        Make sure that the socket transport's vectored writes send all of the
+        buffers, in order, including ones which aren't contiguous.
+        """
+        (ours, theirs) = socket.socketpair()
+        try:
+            transport = pjrmi.SocketTransport.__new__(pjrmi.SocketTransport)
+            transport._socket = ours
+
+            strided = arange(10, dtype='int8')[::2]
+            self.assertFalse(strided.flags['C_CONTIGUOUS'])
+
+            transport.sendmsg((b'head', strided, bytearray(b'tail')))
+            ours.close()
+
+            received = b''
+            while True:
+                chunk = theirs.recv(1024)
+                if not chunk:
+                    break
+                received += chunk
+            self.assertEqual(received, b'head' + strided.tobytes() + b'tail')
+        finally:
+            ours.close()
+            theirs.close()
+
+
     def test_members(self):
         """
         Ensure we can access the static members
@@ -1233,6 +1316,43 @@ public class TestInjectSource {
                                                          java_string_array_class))
 
 
+    def test_should_format_shmdata(self):
+        """
+        Make sure that shmdata passing is used for arrays which are at least the
+        ``min_shm_arg_passing_size``, and not for those smaller than it.
+        """
+        java_double_array_class = get_pjrmi().class_for_name('[D')
+
+        # 127 and 128 doubles; either side of a 1KiB threshold
+        below = numpy.arange(127, dtype='d')
+        above = numpy.arange(128, dtype='d')
+
+        def format_type(value):
+            # Give back the argument type marker of the formatted value
+            return get_pjrmi()._format_by_class(java_double_array_class, value)[:1]
+
+        # By default there is no threshold, so both go by shmdata
+        self.assertTrue(get_pjrmi()._should_format_shmdata(below,
+                                                           java_double_array_class))
+        self.assertTrue(get_pjrmi()._should_format_shmdata(above,
+                                                           java_double_array_class))
+        self.assertEqual(format_type(below), get_pjrmi()._ARGUMENT_SHMDATA)
+        self.assertEqual(format_type(above), get_pjrmi()._ARGUMENT_SHMDATA)
+
+        # With a threshold only the larger one does
+        min_shmdata_size = get_pjrmi()._min_shmdata_size
+        try:
+            get_pjrmi()._min_shmdata_size = 128 * 8
+            self.assertFalse(get_pjrmi()._should_format_shmdata(below,
+                                                                java_double_array_class))
+            self.assertTrue (get_pjrmi()._should_format_shmdata(above,
+                                                                java_double_array_class))
+            self.assertEqual(format_type(below), get_pjrmi()._ARGUMENT_VALUE)
+            self.assertEqual(format_type(above), get_pjrmi()._ARGUMENT_SHMDATA)
+        finally:
+            get_pjrmi()._min_shmdata_size = min_shmdata_size
+
+
     def test_arraylike(self):
         """
         Kick the tires on ArrayLike operations.